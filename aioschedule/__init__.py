@@ -22,7 +22,6 @@ Features:
 Usage:
     >>> import asyncio
     >>> import aioschedule as schedule
-    >>> import time
 
     >>> async def job(message='stuff', n=1):
     >>>     print("Asynchronous invocation (%s) of I'm working on:" % n, message)
@@ -33,27 +32,40 @@ Usage:
     >>> schedule.every(5).to(10).days.do(job)
     >>> schedule.every().hour.do(job, message='things')
     >>> schedule.every().day.at("10:30").do(job)
+    >>> schedule.cron("*/5 9-17 * * 1-5").do(job)
 
-    >>> loop = asyncio.get_event_loop()
-    >>> while True:
-    >>>     loop.run_until_complete(schedule.run_pending())
-    >>>     time.sleep(0.1)
+    >>> asyncio.run(schedule.run_forever())
 
 [1] https://adam.herokuapp.com/past/2010/4/13/rethinking_cron/
 [2] https://github.com/Rykian/clockwork
 [3] https://adam.herokuapp.com/past/2010/6/30/replace_cron_with_clockwork/
 """
 import asyncio
+import concurrent.futures
+import contextlib
 import datetime
 import functools
+import gc
+import heapq
+import itertools
 import logging
 import random
+import time
 import warnings
+import zlib
+import zoneinfo
 
 from typing import cast
+from typing import AbstractSet
 from typing import Any
 from typing import Awaitable
 from typing import Callable
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import Sequence
+
+from aioschedule import crontab as _crontab
 
 
 logger = logging.getLogger('schedule')
@@ -66,16 +78,530 @@ class CancelJob(object):
     pass
 
 
+class JobTimeout(asyncio.TimeoutError):
+    """
+    Raised when a run of a job takes longer than its
+    :meth:`timeout <Job.timeout>`.
+    """
+    pass
+
+
+class Instrument(object):
+    """
+    Base class of objects that are notified when the jobs of a
+    :class:`Scheduler` run, see :attr:`Scheduler.instruments`. All
+    durations are in seconds, measured on the scheduler clock. The
+    hooks are called synchronously from the task running the job and
+    should return quickly.
+    """
+
+    def pre_run(self, job: 'Job', lateness: float, queue_wait: float):
+        """
+        Called before the job_func of *job* is invoked.
+
+        :param lateness: Time between the moment the job was due and
+                         the moment it started.
+        :param queue_wait: Time the job waited for a concurrency slot.
+        """
+
+    def post_run(self, job: 'Job', duration: float):
+        """
+        Called after the job_func of *job* returned.
+        """
+
+    def error(self, job: 'Job', exception: BaseException, duration: float):
+        """
+        Called when the job_func of *job* raised *exception*, or was
+        cancelled.
+        """
+
+    def skipped(self, job: 'Job', reason: str):
+        """
+        Called when an invocation of *job* was skipped.
+
+        :param reason: Why the invocation was skipped: ``'overlap'``,
+                       ``'misfire'`` or ``'locked'``.
+        """
+
+
+class JobStore(object):
+    """
+    Base class of persistent storages for the jobs of a
+    :class:`Scheduler`, see :attr:`Scheduler.jobstore`.
+
+    Jobs whose job_func was added with :meth:`Scheduler.register` are
+    stored, including their last and next run, so that a restarted
+    process resumes their schedule with :meth:`Scheduler.restore`.
+    The scheduler reports changes to the store as they happen, and the
+    store buffers them until :meth:`flush`. New and changed jobs are
+    then written in full, jobs that merely ran only have their times
+    updated.
+
+    Subclasses implement :meth:`load` and :meth:`write`; see
+    :class:`aioschedule.jobstore.SQLiteJobStore`.
+    """
+
+    def __init__(self):
+        self._saved: dict[Hashable, Job] = {}  # jobs to write in full
+        self._moved: dict[Hashable, Job] = {}  # jobs to write the times of
+        self._removed: set[Hashable] = set()  # ids of jobs to delete
+
+    def load(self) -> Iterable[dict[str, Any]]:
+        """
+        :return: The stored jobs, as records passed to :meth:`write`.
+        """
+        raise NotImplementedError
+
+    def write(
+        self,
+        saved: list[dict[str, Any]],
+        moved: list[tuple[Hashable, int | None, int | None, int | None]],
+        removed: list[Hashable]
+    ):
+        """
+        Apply a batch of changes, preferably atomically.
+
+        :param saved: Records of the jobs to insert or replace, with the
+                      keys ``id``, ``func`` (the registered name),
+                      ``args``, ``kwargs``, ``interval``, ``latest``,
+                      ``unit``, ``at_time``, ``cron``, ``tz``,
+                      ``start_day``, ``tags``,
+                      ``overlap``, ``misfire_grace_time``,
+                      ``coalesce``, ``fixed_rate``, ``phase``,
+                      ``executor``, ``timeout``, ``retry_attempts``,
+                      ``retry_backoff``, ``retry_max_backoff``,
+                      ``until``, ``runs_left``,
+                      ``last_run``,
+                      ``next_run`` and ``period``.
+        :param moved: ``(id, last_run, next_run, period)`` tuples of
+                      stored jobs whose times changed.
+        :param removed: The ids of the jobs to delete.
+
+        Times are integers: ``last_run`` and ``next_run`` in
+        microseconds since 1970-01-01 on the local wall clock, or in UTC
+        for the ``next_run`` of jobs with a time zone, ``period`` in
+        nanoseconds. ``tz`` is the name of a time zone.
+        """
+        raise NotImplementedError
+
+    def flush(self):
+        """
+        Write the buffered changes.
+        """
+        if not (self._saved or self._moved or self._removed):
+            return
+        saved = [job._record() for job in self._saved.values()]
+        moved = [job._times() for job in self._moved.values()]
+        removed = list(self._removed)
+        self._saved.clear()
+        self._moved.clear()
+        self._removed.clear()
+        self.write(saved, moved, removed)
+
+    def close(self):
+        """
+        Release the resources of the store.
+        """
+
+    def _save(self, job: 'Job'):
+        self._moved.pop(job.id, None)
+        self._removed.discard(job.id)
+        self._saved[job.id] = job
+
+    def _move(self, job: 'Job'):
+        if job.id not in self._saved:
+            self._moved[job.id] = job
+
+    def _remove(self, job: 'Job'):
+        self._saved.pop(job.id, None)
+        self._moved.pop(job.id, None)
+        self._removed.add(job.id)
+
+
+class LockBackend(object):
+    """
+    Base class of shared lease stores that make sure each occurrence of
+    a job runs once, when several replicas of a process run the same
+    jobs, see :attr:`Scheduler.lock_backend`.
+
+    Before a job runs, the scheduler tries to take a lease on the
+    occurrence. Its key is derived from the :attr:`Job.id`, so the jobs
+    must have the same ids in all replicas, e.g. by using
+    :meth:`Job.with_id`, and from the wall time of the occurrence, so
+    the clocks of the replicas must be synchronized. Leases are never
+    released, they expire. Jobs that are run before they are due, with
+    :meth:`Scheduler.run_all` or :meth:`Job.run`, do not take a lease.
+
+    Subclasses implement :meth:`acquire`; see
+    :class:`aioschedule.locks.SQLiteLockBackend`. In Redis, this is a
+    ``SET key owner NX PX ttl``.
+    """
+
+    async def acquire(self, key: str, ttl: float) -> bool:
+        """
+        Take the lease on *key* if nobody holds it.
+
+        :param key: Identifies a job occurrence.
+        :param ttl: The number of seconds after which the lease expires.
+        :return: ``True`` if the lease was taken, ``False`` if it is
+                 held by another replica.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Release the resources of the backend.
+        """
+
+
+class Clock(object):
+    """
+    Source of time for a :class:`Scheduler`.
+
+    Jobs are ordered and fired on the monotonic clock, which is not
+    affected when the wall clock is stepped (e.g. by NTP). The wall
+    clock is only consulted to place jobs that run at a specific time
+    of day or week, and to report :attr:`Job.next_run`.
+    """
+
+    def monotonic_ns(self) -> int:
+        """
+        :return: The value of a monotonic clock in nanoseconds.
+        """
+        return time.monotonic_ns()
+
+    def now(self) -> datetime.datetime:
+        """
+        :return: The current local wall time as a naive
+                 :class:`~datetime.datetime`.
+        """
+        return datetime.datetime.now()
+
+    def utcnow(self) -> datetime.datetime:
+        """
+        :return: The current wall time as an aware
+                 :class:`~datetime.datetime` in UTC. Used for jobs
+                 with a time zone.
+        """
+        return datetime.datetime.now(_UTC)
+
+
+class FakeClock(Clock):
+    """
+    A :class:`Clock` that only moves when told to, for use in tests
+    and simulations that should run faster than real time.
+
+    :param now: The initial wall time. A naive value is taken as local
+                time, an aware value also fixes :meth:`utcnow`
+                independently of the time zone of the system.
+    """
+
+    def __init__(self, now: datetime.datetime):
+        self._now = now
+        self._monotonic = 0
+
+    def monotonic_ns(self) -> int:
+        return self._monotonic
+
+    def now(self) -> datetime.datetime:
+        if self._now.tzinfo is None:
+            return self._now
+        return self._now.astimezone().replace(tzinfo=None)
+
+    def utcnow(self) -> datetime.datetime:
+        return self._now.astimezone(_UTC)
+
+    def advance(self, seconds: float):
+        """
+        Move both the wall clock and the monotonic clock forward.
+
+        :param seconds: The number of seconds to advance.
+        """
+        delta = datetime.timedelta(seconds=seconds)
+        if self._now.tzinfo is None:
+            self.set(self._now + delta)
+        else:
+            # Aware arithmetic within one zone ignores offset changes.
+            self.set((self._now.astimezone(_UTC) + delta)
+                     .astimezone(self._now.tzinfo))
+
+    def set(self, now: datetime.datetime):
+        """
+        Move the wall clock to *now* and the monotonic clock by the
+        same amount.
+
+        :param now: The new wall time.
+        """
+        if now.tzinfo is None or self._now.tzinfo is None:
+            self._monotonic += _to_ns(now - self._now)
+        else:
+            self._monotonic += _to_ns(now.astimezone(_UTC) -
+                                      self._now.astimezone(_UTC))
+        self._now = now
+
+    def step(self, seconds: float):
+        """
+        Step the wall clock without moving the monotonic clock, like
+        an NTP adjustment would.
+
+        :param seconds: The number of seconds to step, may be negative.
+        """
+        self._now += datetime.timedelta(seconds=seconds)
+
+
+def _to_ns(delta: datetime.timedelta) -> int:
+    # Exact conversion, timedelta.total_seconds() loses precision.
+    return (delta.days * 86400 + delta.seconds) * 10**9 \
+        + delta.microseconds * 1000
+
+
+# Jobs store wall times as integer microseconds since this (naive) epoch
+# and only build datetime objects when they are read.
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def _to_us(t: datetime.datetime) -> int:
+    delta = t - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 10**6 + delta.microseconds
+
+
+def _from_us(us: int) -> datetime.datetime:
+    return _EPOCH + datetime.timedelta(microseconds=us)
+
+
+def _local_ns(later: datetime.datetime, earlier: datetime.datetime) -> int:
+    # Nanoseconds between two naive local wall times. Unlike their plain
+    # difference, this accounts for a change of the UTC offset of the
+    # system time zone in between, e.g. for daylight saving time.
+    return _to_ns(later.astimezone(_UTC) - earlier.astimezone(_UTC))
+
+
+_UTC = datetime.timezone.utc
+
+
+def _zone(tz: datetime.tzinfo | str) -> datetime.tzinfo:
+    return zoneinfo.ZoneInfo(tz) if isinstance(tz, str) else tz
+
+
+@functools.lru_cache(maxsize=4096)
+def _localize(tz: datetime.tzinfo,
+              local: datetime.datetime) -> datetime.datetime:
+    # Convert the naive wall time *local* in *tz* to naive UTC. Times
+    # that do not exist because the clocks were put forward are moved
+    # forward by the length of the gap, ambiguous times resolve to their
+    # first occurrence. Looking up the transitions of a zone is by far
+    # the most expensive step in scheduling a job with a time zone, and
+    # jobs in the same zone mostly fire at the same few wall times.
+    return local.replace(tzinfo=tz).astimezone(_UTC).replace(tzinfo=None)
+
+
+@contextlib.contextmanager
+def _gc_paused():
+    # Suspend the cyclic garbage collector while many jobs are created
+    # at once. The new jobs are not garbage, but every collection
+    # triggered by their allocations traverses all of them again.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _retrieve(task: asyncio.Future[Any]):
+    # Mark the outcome of a task that nobody awaits any more as seen,
+    # so that asyncio does not log it as never retrieved.
+    if not task.cancelled():
+        task.exception()
+
+
+_GOLDEN_RATIO = (5 ** 0.5 - 1) / 2
+
+# Upper bound on the missed occurrences of a cron job that misfire()
+# counts one by one.
+_MAX_MISSED_FIRES = 1000
+
+# Seconds that a run which timed out is given to handle its
+# cancellation before the job stops waiting for it.
+_CANCEL_GRACE = 5.0
+
+
+def _hash_phase(key: Hashable) -> float:
+    # A phase in [0, 1) that only depends on the repr of *key*, unlike
+    # hash(), which is salted per process for strings.
+    return zlib.crc32(repr(key).encode()) / 2**32
+
+
+def _check_spec(spec: dict[str, Any],
+                periods: dict[tuple[int, str], int]
+                ) -> tuple[int, frozenset[Hashable]]:
+    # Validate a spec of Scheduler.add_many(). Returns the period of the
+    # job in nanoseconds, cached in *periods*, and its tags; ``tags``
+    # is a single tag or a list, tuple or set of them.
+    spec['func']
+    interval = spec.get('interval', 1)
+    unit = spec['unit']
+    period = periods.get((interval, unit))
+    if period is None:
+        assert unit in ('seconds', 'minutes', 'hours', 'days', 'weeks')
+        period = _to_ns(datetime.timedelta(**{unit: interval}))
+        periods[interval, unit] = period
+    tags = spec.get('tags')
+    if not tags:
+        return period, _NO_TAGS
+    if not isinstance(tags, (list, tuple, set, frozenset)):
+        tags = (tags,)
+    return period, frozenset(tags)  # TypeError if a tag is unhashable
+
+
+class _JobFunc(object):
+    # Like functools.partial, but without an instance dictionary and
+    # sharing one dictionary between all jobs without keywords. A
+    # partial passed as job_func is kept as is instead of flattened,
+    # so that Job.__repr__() still shows it.
+    __slots__ = ('func', 'args', 'keywords')
+
+    def __init__(self, func: Callable[..., Any], *args: Any, **keywords: Any):
+        self.func = func
+        self.args = args
+        self.keywords = keywords or _NO_KEYWORDS
+
+    def __call__(self) -> Any:
+        return self.func(*self.args, **self.keywords)
+
+
+class JobList(Sequence['Job']):
+    """
+    A read-only, live view of the jobs registered with a
+    :class:`Scheduler`, in the order they were added. Membership
+    tests take constant time.
+    """
+
+    def __init__(self, jobs: dict[Hashable, 'Job']):
+        self._jobs = jobs
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __iter__(self) -> Iterator['Job']:
+        return iter(self._jobs.values())
+
+    def __contains__(self, job: object) -> bool:
+        return self._jobs.get(getattr(job, 'id', None)) is job
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return list(self._jobs.values())[index]
+        if index < 0:
+            index += len(self._jobs)
+        if not 0 <= index < len(self._jobs):
+            raise IndexError('job index out of range')
+        return next(itertools.islice(self._jobs.values(), index, None))
+
+    def __repr__(self):
+        return repr(list(self._jobs.values()))
+
+
 class Scheduler(object):
     """
     Objects instantiated by the :class:`Scheduler <Scheduler>` are
     factories to create jobs, keep record of scheduled jobs and
     handle their execution.
-    """
-    jobs: list['Job']
 
-    def __init__(self):
-        self.jobs = []
+    Scheduled jobs are kept in a priority queue ordered by their
+    :attr:`Job.next_run`, so that :meth:`run_pending` only has to
+    look at the jobs that are due. Registered jobs are also indexed by
+    their :attr:`Job.id` and their tags, so that :meth:`cancel_job`,
+    :meth:`clear` and :meth:`get_jobs` only touch the affected jobs.
+    :attr:`jobs` is a read-only view of all registered jobs.
+
+    :param clock: The :class:`Clock` used to tell time. Defaults to
+                  the system clock.
+    :param max_concurrency: The maximum number of jobs that may run at
+                            the same time. Due jobs beyond this limit
+                            wait for a free slot, in the order of their
+                            due time.
+    :param tag_concurrency: A mapping of tags to the maximum number of
+                            jobs with that tag that may run at the same
+                            time.
+    :param executors: A mapping with the ``'thread'`` and/or
+                      ``'process'`` executors used by
+                      :meth:`Job.do_in_thread` and
+                      :meth:`Job.do_in_process`. Missing executors are
+                      created with default settings when first needed.
+    :param instruments: The :class:`Instrument` objects that are
+                        notified when jobs run. See
+                        :class:`aioschedule.metrics.JobMetrics` for
+                        built-in counters and latency histograms.
+    :param log_sample_rate: The fraction of job runs that are logged at
+                            INFO level, between 0 and 1.
+    :param jobstore: The :class:`JobStore` that keeps the jobs with a
+                     :meth:`registered <register>` job_func across
+                     restarts.
+    :param lock_backend: The :class:`LockBackend` shared with the other
+                         replicas of this scheduler. An occurrence of a
+                         job that another replica has taken is skipped.
+    :param job_timeout: The number of seconds after which a run of a
+                        job without a :meth:`Job.timeout` of its own is
+                        cancelled.
+    :param on_error: Called with the job and the exception when a run
+                     of a job fails. The exception is then considered
+                     handled: the run returns ``None`` instead of
+                     raising it.
+    """
+    clock: Clock
+    instruments: list[Instrument]
+    jobs: JobList
+    log_sample_rate: float
+    jobstore: JobStore | None
+    lock_backend: LockBackend | None
+    job_timeout: float | None
+    on_error: Callable[['Job', Exception], Any] | None
+
+    def __init__(
+        self,
+        clock: Clock | None = None,
+        max_concurrency: int | None = None,
+        tag_concurrency: dict[Hashable, int] | None = None,
+        executors: dict[str, concurrent.futures.Executor] | None = None,
+        instruments: list[Instrument] | None = None,
+        log_sample_rate: float = 1.0,
+        jobstore: JobStore | None = None,
+        lock_backend: LockBackend | None = None,
+        job_timeout: float | None = None,
+        on_error: Callable[['Job', Exception], Any] | None = None
+    ):
+        self.clock = clock or Clock()
+        self.instruments = list(instruments or [])
+        self.log_sample_rate = log_sample_rate
+        self.jobstore = jobstore
+        self.lock_backend = lock_backend
+        self.job_timeout = job_timeout
+        self.on_error = on_error
+        self._jobs: dict[Hashable, Job] = {}  # registered jobs by id
+        self._tags: dict[Hashable, dict[Hashable, Job]] = {}  # jobs by tag
+        self._functions: dict[str, Callable[..., Any]] = {}  # see register()
+        self._names: dict[Callable[..., Any], str] = {}  # inverse of _functions
+        self._checkpoint_handle: asyncio.Handle | None = None
+        self._ids = itertools.count(1)
+        self._phases: dict[int, int] = {}  # see _next_phase()
+        self.jobs = JobList(self._jobs)
+        self._executors = dict(executors or {})
+        self._semaphore = None  # limits the number of running jobs
+        if max_concurrency is not None:
+            self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._tag_semaphores = {
+            tag: asyncio.Semaphore(limit)
+            for tag, limit in (tag_concurrency or {}).items()
+        }
+        self._queue: list[list[Any]] = []  # heap of [due, seq, job]
+        self._sequence = itertools.count()  # tie-breaker for equal times
+        self._stale = 0  # number of cancelled entries left in the heap
+        self._tasks: set[asyncio.Task[Any]] = set()  # jobs started by run_forever()
+        self._wakeup: asyncio.Event | None = None  # set when the queue changes
+        self._loop: asyncio.AbstractEventLoop | None = None  # see start()
+        self._timers: dict[Any, asyncio.TimerHandle] = {}  # by due time
 
     async def run_pending(
         self,
@@ -88,12 +614,15 @@ class Scheduler(object):
         does not run missed jobs*. For example, if you've registered a job
         that should run every minute and you only call run_pending()
         in one hour increments then your job won't be run 60 times in
-        between but only once.
+        between but only once. Use :meth:`Job.misfire` to change this.
 
         *timeout* can be used to control the maximum number of seconds to wait before
         returning.  *timeout* can be an int or float.  If *timeout* is not specified
         or ``None``, there is no limit to the wait time.
 
+        Jobs that are still running when *timeout* expires are not
+        interrupted; use :meth:`Job.timeout` to cancel runs that hang.
+
         *return_when* indicates when this function should return.  It must be one of
         the following constants:
 
@@ -116,13 +645,88 @@ class Scheduler(object):
         +-----------------------------+----------------------------------------+
         """
         jobs: list[asyncio.Task[Any]] = [
-            asyncio.create_task(job.run())
-            for job in self.jobs if job.should_run
+            asyncio.create_task(self._run_job(job))
+            for job in self._pop_due(self.clock.monotonic_ns())
         ]
         if not jobs:
             return [], []
 
-        return await asyncio.wait(jobs, *args, **kwargs)
+        try:
+            return await asyncio.wait(jobs, *args, **kwargs)
+        finally:
+            self.checkpoint()
+
+    async def run_forever(self):
+        """Run jobs as they become due, until cancelled.
+
+        Instead of polling :meth:`run_pending` at a fixed rate, this
+        coroutine sleeps until :attr:`next_run` and wakes up early when
+        jobs are added or cancelled. Due jobs are started as background
+        tasks, so a slow job does not delay the others. Jobs that are
+        still running are cancelled when this coroutine is cancelled.
+        """
+        self._wakeup = wakeup = asyncio.Event()
+        try:
+            while True:
+                wakeup.clear()
+                self._spawn_due()
+                # asyncio.wait_for() may swallow a cancellation that
+                # arrives as the event is set, asyncio.wait() does not.
+                waiter = asyncio.ensure_future(wakeup.wait())
+                try:
+                    await asyncio.wait((waiter,), timeout=self._sleep_time())
+                finally:
+                    waiter.cancel()
+        finally:
+            self._wakeup = None
+            tasks = list(self._tasks)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.checkpoint()
+
+    def start(self, loop: asyncio.AbstractEventLoop | None = None):
+        """Run jobs from event loop timers instead of polling.
+
+        Every distinct due time in the run queue is registered with
+        *loop* through :meth:`~asyncio.loop.call_at`, and jobs are
+        started as background tasks when their timer fires. A job
+        that reschedules itself arms a timer for its new due time.
+        No :meth:`run_pending` or :meth:`run_forever` calls are
+        needed while the scheduler is started.
+
+        :param loop: The event loop to register the timers with. If
+                     omitted, the running event loop is used.
+        """
+        if self._loop is not None:
+            raise RuntimeError('Scheduler is already started.')
+        self._loop = loop or asyncio.get_running_loop()
+        for entry in self._queue:
+            if entry[-1] is not None:
+                self._arm(entry[0])
+
+    def stop(self):
+        """
+        Cancel the timers registered by :meth:`start`. Jobs that are
+        already running are not interrupted.
+        """
+        for handle in self._timers.values():
+            handle.cancel()
+        self._timers.clear()
+        self._loop = None
+        self.checkpoint()
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shut down the executors used to run synchronous jobs. They are
+        created again if another such job runs afterwards.
+
+        :param wait: Wait for the jobs that are running in the
+                     executors to complete.
+        """
+        executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=wait)
 
     async def run_all(
         self,
@@ -175,9 +779,19 @@ class Scheduler(object):
                     jobs to delete
         """
         if tag is None:
-            del self.jobs[:]
+            for job in self._jobs.values():
+                if self._stored(job):
+                    self.jobstore._remove(job)
+                job._registered = False
+                job._entry = None
+            self._jobs.clear()
+            self._tags.clear()
+            del self._queue[:]
+            self._stale = 0
+            self._notify()
         else:
-            self.jobs[:] = (job for job in self.jobs if tag not in job.tags)
+            for job in list(self._tags.get(tag, {}).values()):
+                self.cancel_job(job)
 
     def cancel_job(self, job: 'Job'):
         """
@@ -185,10 +799,39 @@ class Scheduler(object):
 
         :param job: The job to be unscheduled
         """
-        try:
-            self.jobs.remove(job)
-        except ValueError:
-            pass
+        if job not in self.jobs:
+            return
+        assert isinstance(job, Job)
+        del self._jobs[job.id]
+        for tag in job.tags:
+            self._untag(job, tag)
+        if self._stored(job):
+            self.jobstore._remove(job)
+        job._registered = False
+        self._dequeue(job)
+        self._notify()
+
+    def get_job(self, job_id: Hashable) -> 'Job | None':
+        """
+        Look up a registered job by its :attr:`Job.id`.
+
+        :param job_id: The identifier of the job
+        :return: The :class:`Job <Job>`, or ``None`` if no such job is
+                 registered
+        """
+        return self._jobs.get(job_id)
+
+    def get_jobs(self, tag: Hashable | None = None) -> list['Job']:
+        """
+        Gets scheduled jobs marked with the given tag, or all jobs
+        if tag is omitted.
+
+        :param tag: An identifier used to identify a subset of
+                    jobs to retrieve
+        """
+        if tag is None:
+            return list(self._jobs.values())
+        return list(self._tags.get(tag, {}).values())
 
     def every(self, interval: int = 1):
         """
@@ -200,27 +843,379 @@ class Scheduler(object):
         job = Job(interval, self)
         return job
 
+    def cron(self, expression: str, tz: datetime.tzinfo | str | None = None):
+        """
+        Schedule a new job with a cron expression, e.g.
+        ``'*/5 9-17 * * 1-5'`` for every five minutes from 9:00 to 17:55
+        on weekdays. See :mod:`aioschedule.crontab` for the syntax.
+
+        :param expression: A cron expression
+        :param tz: The time zone the expression is evaluated in, see
+                   :meth:`Job.at`. Defaults to the local time.
+        :return: An unconfigured :class:`Job <Job>`
+        """
+        job = Job(1, self)
+        job.cron = _crontab.parse(expression)
+        job.tz = None if tz is None else _zone(tz)
+        return job
+
+    def add_many(self, specs: Iterable[dict[str, Any]]) -> list['Job']:
+        """
+        Schedule many jobs that run at a fixed interval at once, e.g. when
+        loading them at startup. This is equivalent to, but much faster
+        than, calling ``every(interval).<unit>.do(func, *args, **kwargs)``
+        for each of them, because the clock is read once and the jobs are
+        added to the run queue in one go.
+
+        :param specs: Mappings with the keys ``func``, ``unit`` (e.g.
+                      ``'seconds'``) and optionally ``interval``
+                      (defaults to 1), ``args``, ``kwargs``, ``tags``
+                      (a tag or a list of tags), ``id`` (see
+                      :meth:`Job.with_id`) and ``spread``
+                      (``True``, or the key passed to
+                      :meth:`Job.spread`).
+        :return: The scheduled jobs
+        """
+        with _gc_paused():
+            return self._add_many(specs)
+
+    def _add_many(self, specs: Iterable[dict[str, Any]]) -> list['Job']:
+        clock = self.clock
+        monotonic = clock.monotonic_ns()
+        now = _to_us(clock.now())
+        now_ns = now * 1000
+        periods: dict[tuple[int, str], int] = {}
+        jobs: list[Job] = []
+        for spec in specs:
+            period, tags = _check_spec(spec, periods)
+            job = Job(spec.get('interval', 1), self)
+            job.unit = spec['unit']
+            job.job_func = _JobFunc(spec['func'], *spec.get('args', ()),
+                                    **spec.get('kwargs', _NO_KEYWORDS))
+            job.tags = tags
+            job.id = spec.get('id')
+            job._period = period
+            spread = spec.get('spread')
+            if spread is None or spread is False:
+                delay = period
+            else:
+                job.phase = self._next_phase(period) if spread is True \
+                    else _hash_phase(spread)
+                delay = period - (now_ns - int(job.phase * period)) % period
+            job._due = monotonic + delay
+            job._next_run = now + delay // 1000
+            jobs.append(job)
+        # Register the jobs only once all specs are valid.
+        for job in jobs:
+            self._index(job)
+        # Jobs replaced by a later spec with the same id are left out.
+        jobs = [job for job in jobs if job._registered]
+        self._enqueue_many(jobs)
+        return jobs
+
+    def register(
+        self,
+        func: Callable[..., Any],
+        name: str | None = None
+    ) -> Callable[..., Any]:
+        """
+        Register *func* under a name that is stable across restarts, so
+        that the jobs running it are kept in the :attr:`jobstore` and
+        can be restored. Can be used as a decorator.
+
+        :param func: The job function
+        :param name: The name under which *func* is stored. Defaults to
+                     its module and qualified name.
+        :return: *func*
+        """
+        if name is None:
+            name = '%s:%s' % (func.__module__, func.__qualname__)
+        self._functions[name] = func
+        self._names[func] = name
+        return func
+
+    def restore(self) -> list['Job']:
+        """
+        Load the jobs in the :attr:`jobstore` and schedule them at
+        their stored next run, replacing registered jobs with the same
+        id. Jobs that were due while the process was down run on the
+        next :meth:`run_pending`.
+
+        The job functions must have been :meth:`registered <register>`
+        with the names they were stored under; other jobs are skipped
+        with a warning.
+
+        :return: The restored jobs
+        """
+        with _gc_paused():
+            return self._restore()
+
+    def _restore(self) -> list['Job']:
+        assert self.jobstore is not None
+        jobs: list[Job] = []
+        for record in self.jobstore.load():
+            func = self._functions.get(record['func'])
+            if func is None:
+                logger.warning('Cannot restore job %s, %r is not registered',
+                    record['id'], record['func'])
+                continue
+            jobs.append(Job._restore(record, func, self))
+        restored = self._adopt(jobs)
+        for job in restored:
+            self.jobstore._removed.discard(job.id)
+        return restored
+
+    def _adopt(self, jobs: list['Job']) -> list['Job']:
+        # Register jobs rebuilt by Job._restore() and queue them at their
+        # stored next run, replacing registered jobs with the same id.
+        clock = self.clock
+        monotonic = clock.monotonic_ns()
+        now = clock.now()
+        utcnow = _to_us(clock.utcnow().replace(tzinfo=None))
+        for job in jobs:
+            if job.tz is None:
+                job._due = monotonic + _local_ns(_from_us(job._next_run), now)
+            else:
+                job._due = monotonic + (job._next_run - utcnow) * 1000
+            if job.id in self._jobs:
+                self.cancel_job(self._jobs[job.id])
+            self._jobs[job.id] = job
+            for tag in job.tags:
+                self._tag(job, tag)
+            job._registered = True
+        jobs = [job for job in jobs if job._registered]
+        self._enqueue_many(jobs)
+        return jobs
+
+    def checkpoint(self):
+        """
+        Write the changes to the jobs since the last checkpoint to the
+        :attr:`jobstore`. This is done automatically after
+        :meth:`run_pending`, after jobs run by :meth:`run_forever` or
+        :meth:`start` complete, and when they stop.
+        """
+        if self._checkpoint_handle is not None:
+            self._checkpoint_handle.cancel()
+            self._checkpoint_handle = None
+        if self.jobstore is not None:
+            self.jobstore.flush()
+
     async def _run_job(self, job: 'Job'):
-        ret = await job.run()
-        if isinstance(ret, CancelJob) or ret is CancelJob:
-            self.cancel_job(job)
+        # Run *job* for run_pending(), run_forever(), start() and
+        # run_all().
+        dispatched = self.clock.monotonic_ns()
+        try:
+            async with self._admit(job):
+                return await job._run(dispatched)
+        finally:
+            # A job whose run was cancelled stays due, as it did before
+            # the queue. A job that is still running elsewhere is
+            # rescheduled by that invocation.
+            if job._registered and job._entry is None and not job._running:
+                self._enqueue(job)
+
+    @contextlib.asynccontextmanager
+    async def _admit(self, job: 'Job'):
+        # Wait for a slot under the limits of the tags of the job and
+        # the global limit. The semaphores are always acquired in the
+        # same order, so jobs with overlapping tags cannot deadlock, and
+        # the global one last, so that a job waiting for a tag slot does
+        # not hold a global slot that another job could use.
+        async with contextlib.AsyncExitStack() as stack:
+            for tag, semaphore in self._tag_semaphores.items():
+                if tag in job.tags:
+                    await stack.enter_async_context(semaphore)
+            if self._semaphore is not None:
+                await stack.enter_async_context(self._semaphore)
+            yield
+
+    async def _run_in_executor(self, kind: str, func: Callable[[], Any]):
+        if kind not in self._executors:
+            self._executors[kind] = (
+                concurrent.futures.ThreadPoolExecutor() if kind == 'thread'
+                else concurrent.futures.ProcessPoolExecutor()
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executors[kind], func)
+
+    def _add_job(self, job: 'Job'):
+        self._index(job)
+        self._enqueue(job)
+
+    def _index(self, job: 'Job'):
+        # Register *job* by its id and tags, without queueing it.
+        if job.id is None:
+            job.id = next(self._ids)
+            while job.id in self._jobs:  # taken by with_id() or restore()
+                job.id = next(self._ids)
+        elif job.id in self._jobs:
+            self.cancel_job(self._jobs[job.id])
+        self._jobs[job.id] = job
+        for tag in job.tags:
+            self._tag(job, tag)
+        job._registered = True
+        if self._stored(job):
+            self.jobstore._save(job)
+
+    def _next_phase(self, period: int) -> float:
+        # Hand out the phases of spread() jobs without a key: the
+        # fractional parts of the multiples of the golden ratio, counted
+        # per period. However many jobs there are, the largest gap
+        # between them is less than three times the smallest.
+        n = self._phases.get(period, 0)
+        self._phases[period] = n + 1
+        return n * _GOLDEN_RATIO % 1.0
+
+    def _stored(self, job: 'Job') -> bool:
+        # True if *job* is kept in the job store.
+        return self.jobstore is not None and job.job_func.func in self._names
+
+    def _tag(self, job: 'Job', tag: Hashable):
+        self._tags.setdefault(tag, {})[job.id] = job
+
+    def _untag(self, job: 'Job', tag: Hashable):
+        jobs = self._tags[tag]
+        del jobs[job.id]
+        if not jobs:
+            del self._tags[tag]
+
+    def _enqueue(self, job: 'Job'):
+        """
+        Insert *job* into the run queue at its due time, replacing its
+        previous position if it was already queued.
+        """
+        self._dequeue(job)
+        entry = [job._due, next(self._sequence), job]
+        job._entry = entry
+        heapq.heappush(self._queue, entry)
+        if self._queue[0] is entry:
+            self._notify()
+        if self._loop is not None:
+            self._arm(entry[0])
+        if self._stored(job):
+            self.jobstore._move(job)
+
+    def _enqueue_many(self, jobs: list['Job']):
+        # Add the jobs to the run queue at once, which is cheaper than
+        # pushing them one by one.
+        for job in jobs:
+            job._entry = [job._due, next(self._sequence), job]
+            self._queue.append(job._entry)
+        heapq.heapify(self._queue)
+        self._notify()
+        if self._loop is not None:
+            for due in {job._due for job in jobs}:
+                self._arm(due)
+
+    def _notify(self):
+        # Wake up run_forever() so that it recomputes its sleep time.
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _arm(self, due: int):
+        assert self._loop is not None
+        if due in self._timers:
+            return
+        delay = (due - self.clock.monotonic_ns()) / 1e9
+        self._timers[due] = self._loop.call_at(self._loop.time() + delay,
+            self._on_timer, due)
+
+    def _on_timer(self, due: int):
+        del self._timers[due]
+        self._spawn_due()
+        # The timer may fire slightly before the job is due according
+        # to the scheduler clock; make sure the head of the queue is
+        # armed.
+        entry = self._peek()
+        if entry is not None and self._loop is not None:
+            self._arm(entry[0])
+
+    def _spawn_due(self):
+        for job in self._pop_due(self.clock.monotonic_ns()):
+            task = asyncio.create_task(self._run_job(job))
+            task.add_done_callback(self._on_task_done)
+            self._tasks.add(task)
+
+    def _on_task_done(self, task: asyncio.Task[Any]):
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error('Job raised an exception',
+                exc_info=task.exception())
+        # Write the new times of the jobs that completed in the same
+        # iteration of the event loop in one go.
+        if self.jobstore is not None and self._checkpoint_handle is None:
+            self._checkpoint_handle = asyncio.get_running_loop().call_soon(
+                self.checkpoint)
+
+    def _sleep_time(self) -> float | None:
+        idle_seconds = self.idle_seconds
+        return None if idle_seconds is None else max(idle_seconds, 0)
+
+    def _peek(self) -> list[Any] | None:
+        # Return the first valid entry of the run queue, discarding
+        # the entries of cancelled jobs found at the head.
+        queue = self._queue
+        while queue and queue[0][-1] is None:
+            heapq.heappop(queue)
+            self._stale -= 1
+        return queue[0] if queue else None
+
+    def _dequeue(self, job: 'Job'):
+        # Entries are invalidated in place instead of being removed,
+        # which would require a linear search of the heap. The heap is
+        # compacted once the stale entries make up half of it.
+        if job._entry is None:
+            return
+        job._entry[-1] = None
+        job._entry = None
+        self._stale += 1
+        if self._stale * 2 > len(self._queue):
+            self._queue[:] = [e for e in self._queue if e[-1] is not None]
+            heapq.heapify(self._queue)
+            self._stale = 0
+
+    def _pop_due(self, now: int) -> list['Job']:
+        """
+        Remove and return the queued jobs that are due at monotonic
+        time *now*, in the order of their due time.
+        """
+        queue = self._queue
+        due: list[Job] = []
+        while queue and queue[0][0] <= now:
+            job = heapq.heappop(queue)[-1]
+            if job is None:
+                self._stale -= 1
+                continue
+            job._entry = None
+            due.append(job)
+        return due
 
     @property
-    def next_run(self):
+    def next_run(self) -> datetime.datetime | None:
         """
         Datetime when the next job should run.
 
-        :return: A :class:`~datetime.datetime` object
+        This is read from the head of the run queue and does not
+        depend on the number of jobs. Jobs that are running are not
+        taken into account until they have been rescheduled.
+
+        :return: A :class:`~datetime.datetime` object, or ``None`` if
+                 no job is scheduled
         """
-        return min(self.jobs).next_run
+        entry = self._peek()
+        return None if entry is None else entry[-1].next_run
 
     @property
-    def idle_seconds(self):
+    def idle_seconds(self) -> float | None:
         """
         :return: Number of seconds until
-                 :meth:`next_run <Scheduler.next_run>`.
+                 :meth:`next_run <Scheduler.next_run>`, or ``None`` if
+                 no job is scheduled.
         """
-        return (self.next_run - datetime.datetime.now()).total_seconds()
+        entry = self._peek()
+        if entry is None:
+            return None
+        return (entry[0] - self.clock.monotonic_ns()) / 1e9
 
 
 class Job(object):
@@ -239,31 +1234,146 @@ class Job(object):
 
     A job is usually created and returned by :meth:`Scheduler.every`
     method, which also defines its `interval`.
+
+    Jobs are slotted and keep their times as integers, to keep the
+    memory footprint of schedulers with many jobs small.
     """
+    __slots__ = (
+        '_entry', '_registered', '_due', 'id', 'interval', 'latest',
+        'unit', 'at_time', 'cron', 'tz', '_last_run', '_next_run', '_period',
+        'start_day', 'tags', 'scheduler', 'overlap_policy',
+        'misfire_grace_time', 'coalesce', 'fixed_rate', 'phase', 'executor',
+        'run_timeout', 'retry_attempts', 'retry_backoff', 'retry_max_backoff',
+        '_failures', '_resume', 'until_time', 'runs_left', '_running',
+        '_waiting', 'job_func', '_label'
+    )
+    id: Hashable | None
     job_func: Callable[..., Awaitable[Any]]
-    tags: set[str]
+    tags: AbstractSet[Hashable]
 
     def __init__(self, interval: int, scheduler: Scheduler | None = None):
-        n = datetime.datetime.now()
+        self._entry = None  # position in the run queue of the scheduler
+        self._registered = False  # True once added to the scheduler
+        self._due = 0  # monotonic time of the next run, in nanoseconds
+        self.id = None  # see with_id(), or assigned by the scheduler in do()
         self.interval = interval  # pause interval * unit between runs
         self.latest = None  # upper limit to the interval
         self.unit = None  # time units, e.g. 'minutes', 'hours', ...
         self.at_time = None  # optional time at which this job runs
-        self.last_run = n  # datetime of the last run
-        self.next_run = n  # datetime of the next run
-        self.period = None  # timedelta between runs, only valid for
+        self.cron = None  # compiled cron expression, see Scheduler.cron()
+        self.tz = None  # time zone of at_time or cron, see at()
+        self._last_run = None  # wall time of the last run, see _to_us()
+        self._next_run = None  # wall time of the next run, see _to_us()
+        self._period = None  # nanoseconds between runs
         self.start_day = None  # Specific day of the week to start on
-        self.tags = set()  # unique set of tags for the job
+        self.tags = _NO_TAGS  # unique set of tags for the job
         self.scheduler = scheduler  # scheduler to register with
+        self.overlap_policy = 'skip'  # see overlap()
+        self.misfire_grace_time = None  # see misfire()
+        self.coalesce = 'once'  # see misfire()
+        self.fixed_rate = False  # see at_fixed_rate()
+        self.phase = None  # offset of the runs in the period, see spread()
+        self.executor = None  # 'thread' or 'process' for synchronous jobs
+        self.run_timeout = None  # see timeout()
+        self.retry_attempts = 0  # see retry()
+        self.retry_backoff = 1.0
+        self.retry_max_backoff = 300.0
+        self._failures = 0  # failed runs since the last regular one
+        self._resume = None  # regular (_due, _next_run) while retrying
+        self.until_time = None  # no runs after this time, see until()
+        self.runs_left = None  # number of runs left, see times()
+        self._running = _NO_TASKS  # invocations in flight
+        self._waiting = False  # True while an invocation waits in a queue
+        self._label = None  # short description for log records
 
     def __lt__(self, other: 'Job'):
         """
         PeriodicJobs are sortable based on the scheduled time they
         run next.
         """
-        assert self.next_run is not None
-        assert other.next_run is not None
-        return self.next_run < other.next_run
+        assert self._next_run is not None
+        assert other._next_run is not None
+        return self._due < other._due
+
+    @property
+    def last_run(self) -> datetime.datetime | None:
+        """
+        Datetime of the last completed run of this job.
+        """
+        if self._last_run is None:
+            return None
+        return _from_us(self._last_run)
+
+    @last_run.setter
+    def last_run(self, value: datetime.datetime | None):
+        self._last_run = None if value is None else _to_us(value)
+
+    @property
+    def next_run(self) -> datetime.datetime | None:
+        """
+        Datetime when this job should run next. Assigning a new value
+        moves the job in the run queue of its scheduler.
+
+        It is a naive local time, or an aware time in :attr:`tz` for
+        jobs with a time zone.
+        """
+        if self._next_run is None:
+            return None
+        if self.tz is not None:
+            return _from_us(self._next_run).replace(tzinfo=_UTC) \
+                .astimezone(self.tz)
+        return _from_us(self._next_run)
+
+    @next_run.setter
+    def next_run(self, value: datetime.datetime):
+        clock = self._clock
+        if self.tz is None:
+            if value.tzinfo is not None:
+                value = value.astimezone().replace(tzinfo=None)
+            delay = _local_ns(value, clock.now())
+        else:
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=self.tz)
+            value = value.astimezone(_UTC).replace(tzinfo=None)
+            delay = _to_ns(value - clock.utcnow().replace(tzinfo=None))
+        self._set_next_run(clock.monotonic_ns() + delay, value)
+
+    @property
+    def _clock(self) -> Clock:
+        return self.scheduler.clock if self.scheduler else _system_clock
+
+    @property
+    def period(self) -> datetime.timedelta | None:
+        """
+        Time between runs, known once the job has been scheduled.
+        """
+        if self._period is None:
+            return None
+        return datetime.timedelta(microseconds=self._period // 1000)
+
+    def _set_next_run(self, due: int, next_run: datetime.datetime):
+        self._due = due
+        self._next_run = _to_us(next_run)
+        if self._registered:
+            assert self.scheduler is not None
+            if self._expired():
+                self.scheduler.cancel_job(self)
+            else:
+                self.scheduler._enqueue(self)
+
+    def _expired(self) -> bool:
+        # True if the next run is after the until() time of the job.
+        if self.until_time is None or self._next_run is None:
+            return False
+        until_time = self.until_time
+        if self.tz is None:
+            if until_time.tzinfo is not None:
+                until_time = until_time.astimezone().replace(tzinfo=None)
+        else:
+            if until_time.tzinfo is None:
+                until_time = until_time.replace(tzinfo=self.tz)
+            until_time = until_time.astimezone(_UTC).replace(tzinfo=None)
+        return self._next_run > _to_us(until_time)
 
     def __repr__(self):
 
@@ -273,16 +1383,19 @@ class Job(object):
         timestats = '(last run: %s, next run: %s)' % (
                     format_time(self.last_run), format_time(self.next_run))
 
-        if hasattr(self.job_func, '__name__'):
-            job_func_name = self.job_func.__name__
+        if hasattr(self.job_func.func, '__name__'):
+            job_func_name = self.job_func.func.__name__
         else:
-            job_func_name = repr(self.job_func)
+            job_func_name = repr(self.job_func.func)
         args = [repr(x) for x in self.job_func.args]
         kwargs = ['%s=%s' % (k, repr(v))
                   for k, v in self.job_func.keywords.items()]
         call_repr = job_func_name + '(' + ', '.join(args + kwargs) + ')'
 
-        if self.at_time is not None:
+        if self.cron is not None:
+            return 'Cron %r do %s %s' % (
+                   self.cron.expression, call_repr, timestats)
+        elif self.at_time is not None:
             return 'Every %s %s at %s do %s %s' % (
                    self.interval,
                    self.unit[:-1] if self.interval == 1 else self.unit,
@@ -394,7 +1507,7 @@ class Job(object):
         self.start_day = 'sunday'
         return self.weeks
 
-    def tag(self, *tags: set[str]):
+    def tag(self, *tags: Hashable):
         """
         Tags the job with one or more unique indentifiers.
 
@@ -403,17 +1516,47 @@ class Job(object):
         :param tags: A unique list of ``Hashable`` tags.
         :return: The invoked job instance
         """
-        self.tags.update(*tags)
+        if not all(isinstance(tag, Hashable) for tag in tags):
+            raise TypeError('Tags must be hashable')
+        tags_before = self.tags
+        self.tags = self.tags | set(tags)
+        if self._registered:
+            assert self.scheduler is not None
+            for tag in self.tags - tags_before:
+                self.scheduler._tag(self, tag)
+        self._changed()
+        return self
+
+    def with_id(self, job_id: Hashable):
+        """
+        Give the job an identifier of your choice instead of a number
+        assigned by the scheduler. A job with the same id replaces the
+        job registered before it, and ids identify jobs in the
+        :attr:`Scheduler.jobstore` across restarts.
+
+        :param job_id: A hashable identifier, e.g. a string
+        :return: The invoked job instance
+        """
+        assert not self._registered, 'The id of a job cannot change'
+        self.id = job_id
         return self
 
-    def at(self, time_str: str):
+    def at(self, time_str: str, tz: datetime.tzinfo | str | None = None):
         """
         Schedule the job every day at a specific time.
 
         Calling this is only valid for jobs scheduled to run
         every N day(s).
 
+        Without *tz*, the time is the local time of the system. With
+        *tz*, the job runs at that time in the given time zone. On days
+        when the clocks are put forward and the time does not exist,
+        the job runs as much later as the clocks skipped; when the
+        time occurs twice, it runs the first time.
+
         :param time_str: A string in `XX:YY` format.
+        :param tz: A :class:`~zoneinfo.ZoneInfo` or the name of a
+                   time zone, e.g. ``'Europe/Amsterdam'``.
         :return: The invoked job instance
         """
         assert self.unit in ('days', 'hours') or self.start_day
@@ -426,6 +1569,8 @@ class Job(object):
             hour = 0
         assert 0 <= minute <= 59
         self.at_time = datetime.time(int(hour), int(minute))
+        self.tz = None if tz is None else _zone(tz)
+        self._changed()
         return self
 
     def to(self, latest: int):
@@ -441,8 +1586,201 @@ class Job(object):
         :return: The invoked job instance
         """
         self.latest = latest
+        self._changed()
+        return self
+
+    def overlap(self, policy: str):
+        """
+        Specify what happens when the job is due while a previous
+        invocation is still running.
+
+        * ``'skip'`` (the default): do not run the job again; the
+          running invocation reschedules it when it completes.
+        * ``'queue'``: run the job once the running invocation has
+          completed. At most one invocation waits; further ones are
+          skipped.
+        * ``'cancel_previous'``: cancel the running invocation and
+          run the job again.
+
+        :param policy: One of ``'skip'``, ``'queue'`` or
+                       ``'cancel_previous'``.
+        :return: The invoked job instance
+        """
+        assert policy in ('skip', 'queue', 'cancel_previous'), \
+            'Unknown overlap policy: %r' % policy
+        self.overlap_policy = policy
+        self._changed()
         return self
 
+    def misfire(self, grace_time: float | None = None, coalesce: str = 'once'):
+        """
+        Specify what happens when the job starts late, e.g. because the
+        event loop was blocked or :meth:`Scheduler.run_pending` was not
+        called in time.
+
+        A run that starts more than *grace_time* seconds after it was
+        due is a misfire. The occurrences of the job that passed in the
+        meantime are counted from its period, or from its cron
+        expression, up to 1000, and *coalesce* decides what to do about
+        them:
+
+        * ``'once'`` (the default): run the job once.
+        * ``'all'``: run the job once for every missed occurrence.
+        * ``'skip'``: do not run the job; wait for its next occurrence.
+
+        Either way, the next run stays on the grid of the original
+        schedule.
+
+        :param grace_time: The lateness in seconds that is tolerated,
+                           or ``None`` to never count a run as a
+                           misfire.
+        :param coalesce: One of ``'once'``, ``'all'`` or ``'skip'``.
+        :return: The invoked job instance
+        """
+        assert coalesce in ('once', 'all', 'skip'), \
+            'Unknown coalesce policy: %r' % coalesce
+        assert grace_time is None or grace_time >= 0
+        self.misfire_grace_time = grace_time
+        self.coalesce = coalesce
+        self._changed()
+        return self
+
+    def timeout(self, seconds: float | None):
+        """
+        Cancel a run of the job that takes longer than *seconds*.
+
+        A run that times out raises :class:`JobTimeout`, which is
+        reported to the instruments as an error, and the job is
+        rescheduled as if the run had completed. Synchronous jobs cannot
+        be interrupted: their thread or process keeps running, but the
+        job no longer waits for it.
+
+        :param seconds: The maximum duration of a run, or ``None`` to
+                        use the ``job_timeout`` of the scheduler.
+        :return: The invoked job instance
+        """
+        assert seconds is None or seconds > 0
+        self.run_timeout = seconds
+        self._changed()
+        return self
+
+    def retry(self, attempts: int, backoff: float = 1.0,
+              max_backoff: float = 300.0):
+        """
+        Run the job again when a run fails, i.e. when job_func raises
+        or the run :meth:`times out <timeout>`.
+
+        The n-th retry waits a random time between half and all of
+        ``backoff * 2 ** (n - 1)`` seconds, capped at *max_backoff*, so
+        that jobs that failed together do not retry together. Once a
+        retry succeeds, the retries run out, or the next regular run
+        comes first, the job returns to its regular schedule.
+
+        Without retries, a failed run is rescheduled like a successful
+        one.
+
+        :param attempts: The maximum number of retries after a failure.
+        :param backoff: The number of seconds before the first retry.
+        :param max_backoff: The maximum number of seconds between
+                            retries.
+        :return: The invoked job instance
+        """
+        assert attempts >= 0
+        assert 0 < backoff <= max_backoff
+        self.retry_attempts = attempts
+        self.retry_backoff = backoff
+        self.retry_max_backoff = max_backoff
+        self._changed()
+        return self
+
+    def until(self, until_time: datetime.datetime):
+        """
+        Stop running the job after a point in time. The job is
+        cancelled as soon as its next run would be later than
+        *until_time*, and not scheduled at all if its first run would.
+
+        :param until_time: A naive local time, or an aware time. For
+                           jobs with a time zone, a naive time is in
+                           that zone.
+        :return: The invoked job instance
+        """
+        self.until_time = until_time
+        self._changed()
+        return self
+
+    def times(self, runs: int):
+        """
+        Run the job *runs* times and cancel it afterwards. Skipped
+        runs and retries do not count.
+
+        :param runs: The number of runs, at least 1.
+        :return: The invoked job instance
+        """
+        assert runs >= 1
+        self.runs_left = runs
+        self._changed()
+        return self
+
+    def at_fixed_rate(self):
+        """
+        Run the job at a fixed rate rather than with a fixed delay.
+
+        The next run is scheduled one period after the current one was
+        due, before job_func is invoked, so that the duration of a run
+        has no influence on the start of the next one. If a run takes
+        longer than the period, the :meth:`overlap policy <overlap>`
+        applies to the next one. The first run of an interval job is
+        aligned to a multiple of its period on the wall clock, e.g. to
+        the full minute for ``every().minute``.
+
+        :return: The invoked job instance
+        """
+        assert self.latest is None, 'Fixed rate jobs cannot use to()'
+        self.fixed_rate = True
+        self._changed()
+        return self
+
+    def spread(self, key: Hashable | None = None):
+        """
+        Spread the runs of jobs with the same interval over the
+        interval, so that jobs created together do not all run at once.
+
+        The runs of the job are shifted by a fixed phase within the
+        period, on the wall clock grid of :meth:`at_fixed_rate`. With a
+        *key*, the phase is derived from a hash of the key, so it is the
+        same in every process and after a restart. Without one, the
+        scheduler hands out phases that keep all spread jobs with the
+        same interval evenly apart, however many there are.
+
+        Calling this is only valid for jobs with a fixed interval, before
+        :meth:`do`.
+
+        :param key: A key to derive the phase from, e.g. the name of the
+                    device that the job polls.
+        :return: The invoked job instance
+        """
+        assert not self._registered, 'Call spread() before do()'
+        assert self.unit in ('seconds', 'minutes', 'hours', 'days', 'weeks'), \
+            'Set the time unit before spread()'
+        assert self.latest is None, 'Spread jobs cannot use to()'
+        assert self.at_time is None and self.start_day is None, \
+            'Only jobs with a fixed interval can be spread'
+        if key is not None:
+            self.phase = _hash_phase(key)
+        else:
+            assert self.scheduler is not None
+            self.phase = self.scheduler._next_phase(
+                _to_ns(datetime.timedelta(**{self.unit: self.interval})))
+        return self
+
+    def _changed(self):
+        # Write the definition of the job to the job store again after
+        # a builder changed it, if the job is already stored.
+        if self._registered:
+            assert self.scheduler is not None
+            if self.scheduler._stored(self):
+                self.scheduler.jobstore._save(self)
+
     def do(self, job_func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any):
         """
         Specifies the job_func that should be called every time the
@@ -455,18 +1793,36 @@ class Job(object):
         :return: The invoked job instance
         """
         assert self.scheduler is not None
-        self.job_func = functools.partial(job_func, *args, **kwargs)
-        try:
-            functools.update_wrapper(self.job_func, job_func)
-        except AttributeError:
-            # job_funcs already wrapped by functools.partial won't have
-            # __name__, __module__ or __doc__ and the update_wrapper()
-            # call will fail.
-            pass
+        self.job_func = _JobFunc(job_func, *args, **kwargs)
         self._schedule_next_run()
-        self.scheduler.jobs.append(self)
+        if not self._expired():
+            self.scheduler._add_job(self)
         return self
 
+    def do_in_thread(self, job_func: Callable[..., Any], *args: Any, **kwargs: Any):
+        """
+        Like :meth:`do`, for a synchronous job_func that is run in the
+        thread pool of the scheduler, so that blocking calls do not
+        stall the event loop.
+
+        :param job_func: The function to be scheduled
+        :return: The invoked job instance
+        """
+        self.executor = 'thread'
+        return self.do(job_func, *args, **kwargs)
+
+    def do_in_process(self, job_func: Callable[..., Any], *args: Any, **kwargs: Any):
+        """
+        Like :meth:`do`, for a synchronous job_func that is run in the
+        process pool of the scheduler, so that CPU-bound jobs can use
+        all cores. job_func and its arguments must be picklable.
+
+        :param job_func: The function to be scheduled
+        :return: The invoked job instance
+        """
+        self.executor = 'process'
+        return self.do(job_func, *args, **kwargs)
+
     @property
     def should_run(self) -> bool:
         """
@@ -474,24 +1830,377 @@ class Job(object):
         """
         if self.next_run is None:
             return True
-        return datetime.datetime.now() >= self.next_run
+        return self._clock.monotonic_ns() >= self._due
 
     async def run(self):
         """
         Run the job and immediately reschedule it.
 
-        :return: The return value returned by the `job_func`
+        If a previous invocation is still running, the
+        :meth:`overlap policy <Job.overlap>` of the job decides whether
+        this invocation is skipped, waits or replaces it.
+
+        A run that fails is rescheduled too, see :meth:`retry`, and its
+        exception is passed to the ``on_error`` hook of the scheduler,
+        or raised if there is none.
+
+        :return: The return value returned by the `job_func`, or
+                 ``None`` if the invocation was skipped or failed.
+        :raises RuntimeError: If the job was created by a
+                              :class:`aioschedule.sharding.ShardedScheduler`;
+                              it runs in a worker process.
         """
-        logger.info('Running job %s', self)
-        ret = await self.job_func()
-        self.last_run = datetime.datetime.now()
-        self._schedule_next_run()
+        if self.scheduler is not None and \
+                not isinstance(self.scheduler, Scheduler):
+            raise RuntimeError('Job %s runs in a worker process.'
+                % self.label)
+        return await self._run(None)
+
+    async def _run(self, dispatched: int | None):
+        # Run the job; *dispatched* is the monotonic time at which the
+        # scheduler picked it up, before waiting for a concurrency slot.
+        instruments = self.scheduler.instruments if self.scheduler else ()
+        if self._running and not await self._resolve_overlap():
+            if logger.isEnabledFor(logging.INFO):
+                logger.info('Skipping job %s, it is still running',
+                    self.label, extra={'job_id': self.id})
+            for instrument in instruments:
+                instrument.skipped(self, 'overlap')
+            if self.fixed_rate:
+                # The running invocation rescheduled the job already.
+                self._schedule_next_run()
+            return None
+        clock = self._clock
+        started = clock.monotonic_ns()
+        runs = 1
+        # Retries are not misfires, and run in the replica that took the
+        # lease on the failed occurrence.
+        retrying = self._resume is not None
+        if dispatched is not None and self.misfire_grace_time is not None \
+                and not retrying \
+                and started - self._due > self.misfire_grace_time * 1e9:
+            runs = self._count_runs(started)
+            if self.coalesce == 'skip':
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info('Skipping job %s, it missed %d runs',
+                        self.label, runs, extra={'job_id': self.id})
+                for instrument in instruments:
+                    instrument.skipped(self, 'misfire')
+                self._schedule_next_run()
+                return None
+            if self.coalesce == 'once':
+                runs = 1
+        # Only runs of an occurrence that is due take its lease; early
+        # runs, e.g. by run_all() or Job.run(), are not coordinated.
+        if not retrying and dispatched is not None \
+                and started >= self._due and self.scheduler is not None \
+                and self.scheduler.lock_backend is not None \
+                and not await self._acquire_lease(self.scheduler.lock_backend):
+            if logger.isEnabledFor(logging.INFO):
+                logger.info('Skipping job %s, it runs in another replica',
+                    self.label, extra={'job_id': self.id})
+            for instrument in instruments:
+                instrument.skipped(self, 'locked')
+            self._schedule_next_run()
+            return None
+        if instruments:
+            lateness = max(started - self._due, 0) / 1e9
+            queue_wait = 0.0 if dispatched is None \
+                else (started - dispatched) / 1e9
+            for instrument in instruments:
+                instrument.pre_run(self, lateness, queue_wait)
+        if self.fixed_rate and not retrying:
+            self._schedule_next_run()
+        task = asyncio.current_task()
+        assert task is not None
+        self._running = self._running | {task}
+        try:
+            if logger.isEnabledFor(logging.INFO) and self._sample_log():
+                logger.info('Running job %s', self.label,
+                    extra={'job_id': self.id})
+            timeout = self.run_timeout
+            if timeout is None and self.scheduler is not None:
+                timeout = self.scheduler.job_timeout
+            for _ in range(runs):
+                if timeout is None:
+                    ret = await self._invoke()
+                else:
+                    ret = await self._invoke_within(timeout)
+        except BaseException as exception:
+            duration = (clock.monotonic_ns() - started) / 1e9
+            for instrument in instruments:
+                instrument.error(self, exception, duration)
+            if not isinstance(exception, Exception):  # cancelled
+                raise
+            if isinstance(exception, JobTimeout):
+                logger.warning('Job %s timed out after %s seconds',
+                    self.label, exception.args[0], extra={'job_id': self.id})
+            self._retry()
+            on_error = self.scheduler.on_error if self.scheduler else None
+            if on_error is None:
+                raise
+            on_error(self, exception)
+            return None
+        finally:
+            self._running = self._running - {task}
+        if instruments:
+            duration = (clock.monotonic_ns() - started) / 1e9
+            for instrument in instruments:
+                instrument.post_run(self, duration)
+        self.last_run = clock.now()
+        self._failures = 0
+        if isinstance(ret, CancelJob) or ret is CancelJob:
+            if self.scheduler is not None:
+                self.scheduler.cancel_job(self)
+            return ret
+        self._reschedule()
         return ret
 
+    def _retry(self):
+        # Reschedule the job after a failed run: after a backoff while it
+        # has retries left that end before its next regular run, else at
+        # that regular run.
+        if not self.retry_attempts:
+            self._reschedule()
+            return
+        if self._resume is None:
+            if not self.fixed_rate:
+                self._schedule_next_run()
+            self._resume = (self._due, self._next_run)
+        self._failures += 1
+        if self._failures <= self.retry_attempts:
+            delay = min(self.retry_backoff * 2 ** (self._failures - 1),
+                        self.retry_max_backoff)
+            delay_us = int(delay * random.uniform(0.5, 1) * 1e6)
+            monotonic, _, reference = self._wall_clock()
+            if monotonic + delay_us * 1000 < self._resume[0]:
+                self._set_next_run(monotonic + delay_us * 1000,
+                    reference + datetime.timedelta(microseconds=delay_us))
+                return
+        self._failures = 0
+        self._reschedule()
+
+    def _reschedule(self):
+        # Schedule the next regular run of the job, or return to the one
+        # that was scheduled before the retries, unless that was the last
+        # of its times().
+        if self.runs_left is not None:
+            self.runs_left -= 1
+            if self.runs_left <= 0:
+                self._resume = None
+                if self.scheduler is not None:
+                    self.scheduler.cancel_job(self)
+                return
+            if self.scheduler is not None and self.scheduler._stored(self):
+                self.scheduler.jobstore._save(self)
+        if self._resume is not None:
+            self._due, self._next_run = self._resume
+            self._resume = None
+            if self._registered:
+                assert self.scheduler is not None
+                if self._expired():
+                    self.scheduler.cancel_job(self)
+                else:
+                    self.scheduler._enqueue(self)
+        elif not self.fixed_rate:
+            self._schedule_next_run()
+
+    async def _invoke(self) -> Any:
+        if self.executor is None:
+            return await self.job_func()
+        assert self.scheduler is not None
+        return await self.scheduler._run_in_executor(
+            self.executor, self.job_func)
+
+    async def _invoke_within(self, timeout: float) -> Any:
+        # Unlike asyncio.wait_for(), tell a timeout apart from a
+        # TimeoutError raised by job_func.
+        invocation = asyncio.ensure_future(self._invoke())
+        try:
+            done, _ = await asyncio.wait((invocation,), timeout=timeout)
+        except BaseException:
+            invocation.cancel()
+            invocation.add_done_callback(_retrieve)
+            raise
+        if not done:
+            # Like wait_for(), let the invocation unwind before the run
+            # counts as finished, but only for a bounded time.
+            invocation.cancel()
+            done, _ = await asyncio.wait((invocation,),
+                timeout=_CANCEL_GRACE)
+            if not done:
+                logger.warning('Job %s did not stop %s seconds after it '
+                    'was cancelled', self.label, _CANCEL_GRACE,
+                    extra={'job_id': self.id})
+            invocation.add_done_callback(_retrieve)
+            raise JobTimeout(timeout)
+        return invocation.result()
+
+    @property
+    def label(self) -> str:
+        """
+        A short description of the job used in log records: the name of
+        job_func and the job id. Unlike :func:`repr`, it does not format
+        the arguments or times, and it is computed only once.
+        """
+        if self._label is None:
+            func = self.job_func.func
+            self._label = '%s (id %s)' % (
+                getattr(func, '__name__', None) or repr(func), self.id)
+        return self._label
+
+    def _sample_log(self) -> bool:
+        rate = self.scheduler.log_sample_rate if self.scheduler else 1.0
+        return rate >= 1.0 or random.random() < rate
+
+    def _record(self) -> dict[str, Any]:
+        # The definition and times of the job, see JobStore.write().
+        # Jobs whose job_func is not registered are recorded with the
+        # function itself, see aioschedule.sharding.
+        assert self.scheduler is not None
+        func = self.job_func.func
+        return {
+            'id': self.id,
+            'func': self.scheduler._names.get(func, func),
+            'args': self.job_func.args,
+            'kwargs': self.job_func.keywords,
+            'interval': self.interval,
+            'latest': self.latest,
+            'unit': self.unit,
+            'at_time': self.at_time,
+            'cron': None if self.cron is None else self.cron.expression,
+            'tz': None if self.tz is None else str(self.tz),
+            'start_day': self.start_day,
+            'tags': list(self.tags),
+            'overlap': self.overlap_policy,
+            'misfire_grace_time': self.misfire_grace_time,
+            'coalesce': self.coalesce,
+            'fixed_rate': self.fixed_rate,
+            'phase': self.phase,
+            'executor': self.executor,
+            'timeout': self.run_timeout,
+            'retry_attempts': self.retry_attempts,
+            'retry_backoff': self.retry_backoff,
+            'retry_max_backoff': self.retry_max_backoff,
+            'until': self.until_time,
+            'runs_left': self.runs_left,
+            'last_run': self._last_run,
+            'next_run': self._next_run,
+            'period': self._period,
+        }
+
+    def _times(self) -> tuple[Hashable, int | None, int | None, int | None]:
+        return self.id, self._last_run, self._next_run, self._period
+
+    @classmethod
+    def _restore(cls, record: dict[str, Any], func: Callable[..., Any],
+                 scheduler: Scheduler) -> 'Job':
+        # Rebuild a job from a record of _record(), without scheduling it.
+        job = cls(record['interval'], scheduler)
+        job.id = record['id']
+        job.job_func = _JobFunc(func, *record['args'], **record['kwargs'])
+        job.latest = record['latest']
+        job.unit = record['unit']
+        job.at_time = record['at_time']
+        if record['cron'] is not None:
+            job.cron = _crontab.parse(record['cron'])
+        if record['tz'] is not None:
+            job.tz = _zone(record['tz'])
+        job.start_day = record['start_day']
+        if record['tags']:
+            job.tags = frozenset(record['tags'])
+        job.overlap_policy = record['overlap']
+        job.misfire_grace_time = record['misfire_grace_time']
+        job.coalesce = record['coalesce']
+        job.fixed_rate = bool(record['fixed_rate'])
+        job.phase = record['phase']
+        job.executor = record['executor']
+        job.run_timeout = record['timeout']
+        job.retry_attempts = record['retry_attempts']
+        job.retry_backoff = record['retry_backoff']
+        job.retry_max_backoff = record['retry_max_backoff']
+        job.until_time = record['until']
+        job.runs_left = record['runs_left']
+        job._last_run = record['last_run']
+        job._next_run = record['next_run']
+        job._period = record['period']
+        return job
+
+    def _count_runs(self, started: int) -> int:
+        # The number of occurrences that passed by the monotonic time
+        # *started*, counting the one the job was due for. Cron jobs
+        # have no fixed period, so their occurrences are enumerated.
+        if self.cron is None:
+            assert self._period is not None
+            return 1 + (started - self._due) // self._period
+        assert self._next_run is not None
+        _, now, _ = self._wall_clock()
+        occurrence = self.next_run.replace(tzinfo=None)
+        runs = 1
+        while runs < _MAX_MISSED_FIRES:
+            occurrence = self.cron.next_fire(occurrence)
+            if occurrence > now:
+                break
+            runs += 1
+        return runs
+
+    async def _acquire_lease(self, backend: LockBackend) -> bool:
+        # Take the lease on the occurrence that is about to run. Its key
+        # is the scheduled wall time, which interval jobs round down to
+        # a multiple of their period, so that replicas that started at
+        # different times agree on it. The lease outlives the occurrence
+        # by a minute, for replicas whose clocks are behind.
+        assert self._next_run is not None and self._period is not None
+        occurrence = self._next_run
+        if self.cron is None and self.at_time is None \
+                and self.start_day is None:
+            occurrence -= occurrence % max(self._period // 1000, 1)
+        return await backend.acquire('%s@%d' % (self.id, occurrence),
+            self._period / 1e9 + 60)
+
+    async def _resolve_overlap(self) -> bool:
+        # Apply the overlap policy to an invocation that started while
+        # others are in flight. Returns False if it must be skipped.
+        if self.overlap_policy == 'skip':
+            return False
+        if self.overlap_policy == 'cancel_previous':
+            for task in self._running:
+                task.cancel()
+        elif self._waiting:
+            return False
+        self._waiting = True
+        try:
+            while self._running:
+                await asyncio.wait(list(self._running))
+        finally:
+            self._waiting = False
+        return True
+
     def _schedule_next_run(self):
         """
         Compute the instant when this job should run next.
+
+        Jobs that run at a fixed interval are scheduled on the monotonic
+        clock only, one period after the time they were due rather than
+        after the time they ran, so that slow runs do not make them
+        drift. Jobs that run at a specific time of day or week, or
+        follow a cron expression, are placed using the wall clock and
+        converted to monotonic time.
         """
+        if self.cron is not None:
+            monotonic, now, reference = self._wall_clock()
+            # Never fire twice for the same minute, even if the wall
+            # clock is slightly behind the monotonic one.
+            after = now
+            if self._next_run is not None:
+                after = max(now, self.next_run.replace(tzinfo=None))
+            next_run = self.cron.next_fire(after)
+            # The gap to the occurrence after that one stands in for
+            # the period, e.g. for the lifetime of leases.
+            self._period = _to_ns(self.cron.next_fire(next_run) - next_run)
+            self._place(monotonic, reference, next_run)
+            return
+
         assert self.unit in ('seconds', 'minutes', 'hours', 'days', 'weeks')
 
         if self.latest is not None:
@@ -500,8 +2209,27 @@ class Job(object):
         else:
             interval = self.interval
 
-        self.period = datetime.timedelta(**{self.unit: interval})
-        self.next_run = datetime.datetime.now() + self.period
+        period = datetime.timedelta(**{self.unit: interval})
+        self._period = _to_ns(period)
+        monotonic, now, reference = self._wall_clock()
+        next_run = now + period
+        if self.start_day is None and self.at_time is None:
+            if self._next_run is not None and self._due <= monotonic:
+                # Skip the occurrences that passed while the job was
+                # late or running.
+                missed = (monotonic - self._due) // self._period
+                due = self._due + self._period * (missed + 1)
+            elif self.fixed_rate or self.phase is not None:
+                # Align to the period grid of the wall clock, shifted by
+                # the phase of spread jobs.
+                offset = int((self.phase or 0) * self._period)
+                due = monotonic + self._period - \
+                    (_to_us(now) * 1000 - offset) % self._period
+            else:
+                due = monotonic + self._period
+            self._set_next_run(due, reference + datetime.timedelta(
+                microseconds=(due - monotonic) // 1000))
+            return
         if self.start_day is not None:
             assert self.unit == 'weeks'
             weekdays = (
@@ -515,10 +2243,10 @@ class Job(object):
             )
             assert self.start_day in weekdays
             weekday = weekdays.index(self.start_day)
-            days_ahead = weekday - self.next_run.weekday()
+            days_ahead = weekday - next_run.weekday()
             if days_ahead <= 0:  # Target day already happened this week
                 days_ahead += 7
-            self.next_run += datetime.timedelta(days_ahead) - self.period
+            next_run += datetime.timedelta(days_ahead) - period
         if self.at_time is not None:
             assert self.unit in ('days', 'hours') or self.start_day is not None
             kwargs: dict[str, int] = {
@@ -528,21 +2256,58 @@ class Job(object):
             }
             if self.unit == 'days' or self.start_day is not None:
                 kwargs['hour'] = self.at_time.hour
-            self.next_run = self.next_run.replace(tzinfo=None, **kwargs)
+            next_run = next_run.replace(tzinfo=None, **kwargs)
             # If we are running for the first time, make sure we run
             # at the specified time *today* (or *this hour*) as well
             if not self.last_run:
-                now = datetime.datetime.now()
                 if (self.unit == 'days' and self.at_time > now.time() and
                         self.interval == 1):
-                    self.next_run = self.next_run - datetime.timedelta(days=1)
+                    next_run = next_run - datetime.timedelta(days=1)
                 elif self.unit == 'hours' and self.at_time.minute > now.minute:
-                    self.next_run = self.next_run - datetime.timedelta(hours=1)
+                    next_run = next_run - datetime.timedelta(hours=1)
         if self.start_day is not None and self.at_time is not None:
             # Let's see if we will still make that time we specified today
-            if (self.next_run - datetime.datetime.now()).days >= 7:
-                self.next_run -= self.period
-
+            if (next_run - now).days >= 7:
+                next_run -= period
+        self._place(monotonic, reference, next_run)
+
+    def _wall_clock(self) -> tuple[int, datetime.datetime, datetime.datetime]:
+        # Read the clock: the monotonic time, the wall time in the time
+        # zone of the job as a naive datetime, and the wall time that
+        # next_run is stored relative to, i.e. UTC for jobs with a time
+        # zone.
+        clock = self._clock
+        monotonic = clock.monotonic_ns()
+        if self.tz is None:
+            now = clock.now()
+            return monotonic, now, now
+        utcnow = clock.utcnow()
+        return (monotonic, utcnow.astimezone(self.tz).replace(tzinfo=None),
+                utcnow.replace(tzinfo=None))
+
+    def _place(self, monotonic: int, reference: datetime.datetime,
+               next_run: datetime.datetime):
+        # Schedule the job at the naive wall time *next_run* in its time
+        # zone, or in the system time zone; all jobs share the monotonic
+        # run queue.
+        if self.tz is None:
+            self._set_next_run(monotonic + _local_ns(next_run, reference),
+                next_run)
+            return
+        next_run = _localize(self.tz, next_run)
+        self._set_next_run(monotonic + _to_ns(next_run - reference), next_run)
+
+
+# Clock of jobs that are not attached to a Scheduler.
+_system_clock = Clock()
+
+# Shared empty defaults of Job.tags and Job._running; both are replaced
+# by a new set when they change.
+_NO_TAGS: frozenset[Hashable] = frozenset()
+_NO_TASKS: frozenset[asyncio.Task[Any]] = frozenset()
+
+# Shared by job functions without keyword arguments; never mutated.
+_NO_KEYWORDS: dict[str, Any] = {}
 
 # The following methods are shortcuts for not having to
 # create a Scheduler instance:
@@ -561,6 +2326,13 @@ def every(interval: int = 1):
     return default_scheduler.every(interval)
 
 
+def cron(expression: str, tz: datetime.tzinfo | str | None = None):
+    """Calls :meth:`cron <Scheduler.cron>` on the
+    :data:`default scheduler instance <default_scheduler>`.
+    """
+    return default_scheduler.cron(expression, tz)
+
+
 async def run_pending():
     """Calls :meth:`run_pending <Scheduler.run_pending>` on the
     :data:`default scheduler instance <default_scheduler>`.
@@ -568,6 +2340,13 @@ async def run_pending():
     return await default_scheduler.run_pending()
 
 
+async def run_forever():
+    """Calls :meth:`run_forever <Scheduler.run_forever>` on the
+    :data:`default scheduler instance <default_scheduler>`.
+    """
+    await default_scheduler.run_forever()
+
+
 async def run_all(delay_seconds: int = 0):
     """Calls :meth:`run_all <Scheduler.run_all>` on the
     :data:`default scheduler instance <default_scheduler>`.
@@ -582,6 +2361,13 @@ def clear(tag: str | None = None):
     default_scheduler.clear(tag)
 
 
+def get_jobs(tag: Hashable | None = None):
+    """Calls :meth:`get_jobs <Scheduler.get_jobs>` on the
+    :data:`default scheduler instance <default_scheduler>`.
+    """
+    return default_scheduler.get_jobs(tag)
+
+
 def cancel_job(job: Job):
     """Calls :meth:`cancel_job <Scheduler.cancel_job>` on the
     :data:`default scheduler instance <default_scheduler>`.
@@ -0,0 +1,180 @@
+"""
+Cron expressions for :meth:`aioschedule.Scheduler.cron`.
+
+An expression has five fields separated by whitespace::
+
+    minute  hour  day-of-month  month  day-of-week
+    0-59    0-23  1-31          1-12   0-7 (0 and 7 are Sunday)
+
+Each field is ``*``, a value, a range ``a-b``, a step ``*/n`` or
+``a-b/n``, or a comma-separated list of those. Months and days of the
+week may also be given by their English abbreviations (``jan``,
+``mon``, ...). As in cron, a day matches if it matches the day of the
+month *or* the day of the week when both are restricted, i.e. not
+``*``; a step such as ``*/2`` restricts its field. The aliases
+``@yearly``, ``@monthly``, ``@weekly``, ``@daily`` and ``@hourly`` are
+accepted as well.
+
+Expressions are compiled into bitsets, so that finding the next match
+takes a handful of bit operations per field instead of a search
+through the calendar.
+"""
+import calendar
+import datetime
+import functools
+
+
+_ALIASES = {
+    '@yearly': '0 0 1 1 *',
+    '@annually': '0 0 1 1 *',
+    '@monthly': '0 0 1 * *',
+    '@weekly': '0 0 * * 0',
+    '@daily': '0 0 * * *',
+    '@midnight': '0 0 * * *',
+    '@hourly': '0 * * * *',
+}
+
+_MONTHS = {
+    name: number for number, name in enumerate((
+        'jan', 'feb', 'mar', 'apr', 'may', 'jun',
+        'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1)
+}
+
+_WEEKDAYS = {
+    name: number for number, name in enumerate((
+        'sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat'))
+}
+
+
+class CronExpression(object):
+    """
+    A compiled cron expression.
+
+    :param expression: The expression, see :mod:`aioschedule.crontab`.
+    :raises ValueError: If the expression is malformed.
+    """
+    __slots__ = (
+        'expression', 'minutes', 'hours', 'days', 'months', 'weekdays',
+        '_any_day', '_any_weekday', '_weekday_days'
+    )
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        fields = _ALIASES.get(expression.strip(), expression).split()
+        if len(fields) != 5:
+            raise ValueError('Cron expressions have 5 fields: %r'
+                % expression)
+        # Bit n of each mask is set if the field matches value n.
+        self.minutes = _parse(fields[0], 0, 59, {})
+        self.hours = _parse(fields[1], 0, 23, {})
+        self.days = _parse(fields[2], 1, 31, {})
+        self.months = _parse(fields[3], 1, 12, _MONTHS)
+        weekdays = _parse(fields[4], 0, 7, _WEEKDAYS)
+        self.weekdays = (weekdays | weekdays >> 7) & 0x7f
+        self._any_day = fields[2] == '*'
+        self._any_weekday = fields[4] == '*'
+        # The days of a month that match self.weekdays, for each
+        # weekday of the first of the month (0 is Sunday).
+        self._weekday_days = tuple(
+            sum(1 << day for day in range(1, 32)
+                if self.weekdays >> ((first + day - 1) % 7) & 1)
+            for first in range(7)
+        )
+
+    def __repr__(self):
+        return 'CronExpression(%r)' % self.expression
+
+    def next_fire(self, after: datetime.datetime) -> datetime.datetime:
+        """
+        :return: The first time after *after* that matches the
+                 expression, with the tzinfo of *after*.
+        :raises ValueError: If the expression never matches, e.g.
+                            ``0 0 30 2 *``.
+        """
+        start = after.replace(second=0, microsecond=0) + \
+            datetime.timedelta(minutes=1)
+        year, month, day = start.year, start.month, start.day
+        hour, minute = start.hour, start.minute
+        # Every iteration moves to the next candidate month, day or
+        # hour; 400 years cover all combinations of leap years and
+        # weekdays.
+        while year <= after.year + 400:
+            found = _next_bit(self.months, month)
+            if found is None:
+                year, month, day, hour, minute = year + 1, 1, 1, 0, 0
+                continue
+            if found != month:
+                month, day, hour, minute = found, 1, 0, 0
+            found = _next_bit(self._days_of(year, month), day)
+            if found is None:
+                month, day, hour, minute = month + 1, 1, 0, 0
+                continue
+            if found != day:
+                day, hour, minute = found, 0, 0
+            found = _next_bit(self.hours, hour)
+            if found is None:
+                day, hour, minute = day + 1, 0, 0
+                continue
+            if found != hour:
+                hour, minute = found, 0
+            found = _next_bit(self.minutes, minute)
+            if found is None:
+                hour, minute = hour + 1, 0
+                continue
+            return datetime.datetime(year, month, day, hour, found,
+                tzinfo=after.tzinfo)
+        raise ValueError('%r never matches' % self.expression)
+
+    def _days_of(self, year: int, month: int) -> int:
+        # The mask of the days of the given month that match.
+        first, ndays = calendar.monthrange(year, month)
+        weekday_days = self._weekday_days[(first + 1) % 7]
+        if self._any_day or self._any_weekday:
+            days = self.days & weekday_days
+        else:
+            days = self.days | weekday_days
+        return days & ((2 << ndays) - 2)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse(expression: str) -> CronExpression:
+    """
+    Compile *expression*. Jobs that use the same expression share the
+    compiled :class:`CronExpression`.
+    """
+    return CronExpression(expression)
+
+
+def _parse(field: str, low: int, high: int, names: dict[str, int]) -> int:
+    mask = 0
+    for part in field.lower().split(','):
+        values, _, step = part.partition('/')
+        if values == '*':
+            first, last = low, high
+        else:
+            start, _, end = values.partition('-')
+            first = _value(start, low, high, names)
+            last = _value(end, low, high, names) if end else \
+                (high if step else first)
+        if step and (not step.isdigit() or int(step) == 0):
+            raise ValueError('Invalid step in cron field %r' % field)
+        if first > last:
+            raise ValueError('Invalid range in cron field %r' % field)
+        for value in range(first, last + 1, int(step or 1)):
+            mask |= 1 << value
+    return mask
+
+
+def _value(text: str, low: int, high: int, names: dict[str, int]) -> int:
+    if text in names:
+        return names[text]
+    if not text.isdigit() or not low <= int(text) <= high:
+        raise ValueError('Invalid cron value %r, expected %d-%d'
+            % (text, low, high))
+    return int(text)
+
+
+def _next_bit(mask: int, n: int) -> int | None:
+    # The position of the lowest bit of *mask* at or above *n*.
+    mask = mask >> n << n
+    return (mask & -mask).bit_length() - 1 if mask else None
@@ -0,0 +1,135 @@
+"""
+Persistent job stores for :class:`aioschedule.Scheduler`.
+
+Usage:
+    >>> import aioschedule
+    >>> from aioschedule.jobstore import SQLiteJobStore
+
+    >>> scheduler = aioschedule.Scheduler(
+    >>>     jobstore=SQLiteJobStore('schedule.db'))
+    >>> scheduler.register(job)
+    >>> scheduler.restore()
+    >>> if scheduler.get_job('report') is None:
+    >>>     scheduler.every().day.at('10:30').with_id('report').do(job)
+"""
+import datetime
+import pickle
+import sqlite3
+from typing import Any
+from typing import Hashable
+from typing import Iterator
+
+from aioschedule import JobStore
+
+
+class SQLiteJobStore(JobStore):
+    """
+    A :class:`~aioschedule.JobStore` that keeps jobs in a table of a
+    SQLite database, one row per job. Each :meth:`flush` is a single
+    transaction that only touches the rows of the jobs that changed.
+
+    Job arguments and tags are pickled, so the database must not be
+    writable by untrusted parties. Job ids must be integers or strings.
+
+    :param path: The path of the database file, or ``':memory:'``.
+    :param table: The name of the table, which is created if needed.
+    """
+    _COLUMNS = (
+        'id', 'func', 'args', 'interval', 'latest', 'unit', 'at_time',
+        'cron', 'tz', 'start_day', 'tags', 'overlap', 'misfire_grace_time',
+        'coalesce', 'fixed_rate', 'phase', 'executor', 'timeout',
+        'retry_attempts', 'retry_backoff', 'retry_max_backoff', 'until',
+        'runs_left', 'last_run', 'next_run', 'period'
+    )
+
+    def __init__(self, path: str, table: str = 'aioschedule_jobs'):
+        super().__init__()
+        assert table.isidentifier(), 'Invalid table name: %r' % table
+        self.table = table
+        self.connection = sqlite3.connect(path)
+        # Checkpoints are frequent and small: append them to the
+        # write-ahead log instead of syncing the database every time.
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        with self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS %s (id PRIMARY KEY, func TEXT,'
+                ' args BLOB, interval, latest, unit TEXT, at_time TEXT,'
+                ' cron TEXT, tz TEXT, start_day TEXT, tags BLOB, overlap TEXT,'
+                ' misfire_grace_time REAL, coalesce TEXT, fixed_rate INTEGER,'
+                ' phase REAL, executor TEXT, timeout REAL,'
+                ' retry_attempts INTEGER, retry_backoff REAL,'
+                ' retry_max_backoff REAL, until TEXT, runs_left INTEGER,'
+                ' last_run INTEGER, next_run INTEGER, period INTEGER)' % table)
+
+    def load(self) -> Iterator[dict[str, Any]]:
+        cursor = self.connection.execute(
+            'SELECT %s FROM %s' % (', '.join(self._COLUMNS), self.table))
+        loads = pickle.loads
+        for (job_id, func, args, interval, latest, unit, at_time, cron, tz,
+                start_day, tags, overlap, misfire_grace_time, coalesce,
+                fixed_rate, phase, executor, timeout, retry_attempts,
+                retry_backoff, retry_max_backoff, until, runs_left, last_run,
+                next_run, period) in cursor:
+            args, kwargs = loads(args)
+            yield {
+                'id': job_id, 'func': func, 'args': args, 'kwargs': kwargs,
+                'interval': interval, 'latest': latest, 'unit': unit,
+                'at_time': at_time and datetime.time.fromisoformat(at_time),
+                'cron': cron, 'tz': tz, 'start_day': start_day,
+                'tags': loads(tags),
+                'overlap': overlap, 'misfire_grace_time': misfire_grace_time,
+                'coalesce': coalesce, 'fixed_rate': fixed_rate, 'phase': phase,
+                'executor': executor, 'timeout': timeout,
+                'retry_attempts': retry_attempts,
+                'retry_backoff': retry_backoff,
+                'retry_max_backoff': retry_max_backoff,
+                'until': until and datetime.datetime.fromisoformat(until),
+                'runs_left': runs_left, 'last_run': last_run,
+                'next_run': next_run, 'period': period,
+            }
+
+    def write(
+        self,
+        saved: list[dict[str, Any]],
+        moved: list[tuple[Hashable, int | None, int | None, int | None]],
+        removed: list[Hashable]
+    ):
+        with self.connection:
+            if removed:
+                self.connection.executemany(
+                    'DELETE FROM %s WHERE id = ?' % self.table,
+                    [(job_id,) for job_id in removed])
+            if saved:
+                self.connection.executemany(
+                    'INSERT OR REPLACE INTO %s (%s) VALUES (%s)' % (
+                        self.table, ', '.join(self._COLUMNS),
+                        ', '.join('?' * len(self._COLUMNS))),
+                    [_row(record) for record in saved])
+            if moved:
+                self.connection.executemany(
+                    'UPDATE %s SET last_run = ?, next_run = ?, period = ?'
+                    ' WHERE id = ?' % self.table,
+                    [times[1:] + times[:1] for times in moved])
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+
+def _row(record: dict[str, Any]) -> tuple[Any, ...]:
+    at_time = record['at_time']
+    until = record['until']
+    return (
+        record['id'], record['func'],
+        pickle.dumps((record['args'], record['kwargs'])),
+        record['interval'], record['latest'], record['unit'],
+        None if at_time is None else at_time.isoformat(), record['cron'],
+        record['tz'], record['start_day'], pickle.dumps(record['tags']),
+        record['overlap'], record['misfire_grace_time'],
+        record['coalesce'], record['fixed_rate'], record['phase'],
+        record['executor'], record['timeout'], record['retry_attempts'],
+        record['retry_backoff'], record['retry_max_backoff'],
+        None if until is None else until.isoformat(), record['runs_left'],
+        record['last_run'], record['next_run'], record['period'],
+    )
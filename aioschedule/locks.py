@@ -0,0 +1,63 @@
+"""
+Lease locks that make each occurrence of a job run once across the
+replicas of a process, see :attr:`aioschedule.Scheduler.lock_backend`.
+
+Usage:
+    >>> import aioschedule
+    >>> from aioschedule.locks import SQLiteLockBackend
+
+    >>> scheduler = aioschedule.Scheduler(
+    >>>     lock_backend=SQLiteLockBackend('/var/lib/app/locks.db'))
+    >>> scheduler.every().minute.with_id('sync').do(job)
+"""
+import os
+import socket
+import sqlite3
+import time
+
+from aioschedule import LockBackend
+
+
+class SQLiteLockBackend(LockBackend):
+    """
+    A :class:`~aioschedule.LockBackend` that keeps leases in a table of a
+    SQLite database, for replicas that run on the same machine. A lease
+    is taken by inserting its key, which the primary key constraint only
+    allows once, and expired leases are deleted on the way.
+
+    Each lease takes a short write transaction, during which the event
+    loop is blocked.
+
+    :param path: The path of the database file, shared by the replicas.
+    :param table: The name of the table, which is created if needed.
+    """
+
+    def __init__(self, path: str, table: str = 'aioschedule_locks'):
+        assert table.isidentifier(), 'Invalid table name: %r' % table
+        self.table = table
+        self.owner = '%s:%d' % (socket.gethostname(), os.getpid())
+        self.connection = sqlite3.connect(path, timeout=10)
+        # A lease only has to survive a crash of the process, not of the
+        # machine: do not sync the write-ahead log on every commit.
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        with self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS %s (key TEXT PRIMARY KEY,'
+                ' owner TEXT, expires REAL)' % table)
+            self.connection.execute(
+                'CREATE INDEX IF NOT EXISTS %s_expires ON %s (expires)'
+                % (table, table))
+
+    async def acquire(self, key: str, ttl: float) -> bool:
+        now = time.time()
+        with self.connection:
+            self.connection.execute(
+                'DELETE FROM %s WHERE expires <= ?' % self.table, (now,))
+            cursor = self.connection.execute(
+                'INSERT OR IGNORE INTO %s (key, owner, expires)'
+                ' VALUES (?, ?, ?)' % self.table, (key, self.owner, now + ttl))
+        return cursor.rowcount == 1
+
+    def close(self):
+        self.connection.close()
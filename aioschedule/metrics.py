@@ -0,0 +1,230 @@
+"""
+Per-job execution metrics for :class:`aioschedule.Scheduler`.
+
+Usage:
+    >>> import aioschedule
+    >>> from aioschedule.metrics import JobMetrics
+
+    >>> metrics = JobMetrics()
+    >>> scheduler = aioschedule.Scheduler(instruments=[metrics])
+    >>> ...
+    >>> metrics.snapshot()
+    >>> print(metrics.render_prometheus())
+"""
+import bisect
+from typing import Any
+from typing import Hashable
+
+from aioschedule import Instrument
+from aioschedule import Job
+
+
+#: Upper bounds, in seconds, of the buckets of a :class:`Histogram`.
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0
+)
+
+
+class Histogram(object):
+    """
+    Counts observations in a fixed set of buckets, so that memory use
+    and the cost of an observation do not grow with the number of
+    observations.
+
+    :param buckets: The sorted upper bounds of the buckets. Values
+                    above the last bound are counted in an implicit
+                    overflow bucket.
+    """
+    __slots__ = ('buckets', 'counts', 'count', 'sum')
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """
+        Record *value*.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Estimate the *q*-quantile (0 <= q <= 1) by linear interpolation
+        within the bucket that contains it.
+
+        :return: The estimate in the unit of the observations, or
+                 ``None`` if nothing was observed. Quantiles that fall in
+                 the overflow bucket are reported as the last bound.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if i == len(self.buckets):
+                    break
+                lower = self.buckets[i - 1] if i else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        :return: The count, sum, p50 and p99 of the observations.
+        """
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'p50': self.quantile(0.5),
+            'p99': self.quantile(0.99),
+        }
+
+
+class JobStats(object):
+    """
+    Counters and latency histograms of a single job.
+    """
+    __slots__ = (
+        'name', 'runs', 'failures', 'skipped', 'lateness', 'duration',
+        'queue_wait'
+    )
+
+    def __init__(self, name: str, buckets: tuple[float, ...]):
+        self.name = name
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0
+        self.lateness = Histogram(buckets)
+        self.duration = Histogram(buckets)
+        self.queue_wait = Histogram(buckets)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            'name': self.name,
+            'runs': self.runs,
+            'failures': self.failures,
+            'skipped': self.skipped,
+            'lateness': self.lateness.snapshot(),
+            'duration': self.duration.snapshot(),
+            'queue_wait': self.queue_wait.snapshot(),
+        }
+
+
+class JobMetrics(Instrument):
+    """
+    An :class:`~aioschedule.Instrument` that keeps :class:`JobStats`
+    for every job it sees, keyed by :attr:`Job.id <aioschedule.Job.id>`.
+
+    Statistics of cancelled jobs are kept until :meth:`forget` or
+    :meth:`reset` is called.
+
+    :param buckets: The bucket bounds of the latency histograms.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.jobs: dict[Hashable, JobStats] = {}
+
+    def stats(self, job: Job) -> JobStats:
+        """
+        :return: The :class:`JobStats` of *job*, created if needed.
+        """
+        try:
+            return self.jobs[job.id]
+        except KeyError:
+            func = job.job_func.func
+            stats = self.jobs[job.id] = JobStats(
+                getattr(func, '__name__', None) or repr(func), self.buckets)
+            return stats
+
+    def pre_run(self, job: Job, lateness: float, queue_wait: float):
+        stats = self.stats(job)
+        stats.lateness.observe(lateness)
+        stats.queue_wait.observe(queue_wait)
+
+    def post_run(self, job: Job, duration: float):
+        stats = self.stats(job)
+        stats.runs += 1
+        stats.duration.observe(duration)
+
+    def error(self, job: Job, exception: BaseException, duration: float):
+        stats = self.stats(job)
+        stats.runs += 1
+        stats.failures += 1
+        stats.duration.observe(duration)
+
+    def skipped(self, job: Job, reason: str):
+        self.stats(job).skipped += 1
+
+    def forget(self, job: Job):
+        """
+        Drop the statistics of *job*.
+        """
+        self.jobs.pop(job.id, None)
+
+    def reset(self):
+        """
+        Drop the statistics of all jobs.
+        """
+        self.jobs.clear()
+
+    def snapshot(self) -> dict[Hashable, dict[str, Any]]:
+        """
+        :return: A plain dictionary with the statistics of each job,
+                 keyed by job id.
+        """
+        return {
+            job_id: stats.snapshot()
+            for job_id, stats in list(self.jobs.items())
+        }
+
+    def render_prometheus(self, prefix: str = 'aioschedule') -> str:
+        """
+        Render the statistics in the Prometheus text exposition format.
+
+        :param prefix: The prefix of the metric names.
+        :return: The metrics, one sample per line.
+        """
+        lines: list[str] = []
+        jobs = list(self.jobs.items())
+        for metric, attr in (('runs', 'runs'), ('failures', 'failures'),
+                             ('skipped', 'skipped')):
+            name = '%s_job_%s_total' % (prefix, metric)
+            lines.append('# TYPE %s counter' % name)
+            for job_id, stats in jobs:
+                lines.append('%s{%s} %d' % (
+                    name, _labels(job_id, stats), getattr(stats, attr)))
+        for attr in ('lateness', 'duration', 'queue_wait'):
+            name = '%s_job_%s_seconds' % (prefix, attr)
+            lines.append('# TYPE %s histogram' % name)
+            for job_id, stats in jobs:
+                histogram: Histogram = getattr(stats, attr)
+                labels = _labels(job_id, stats)
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append('%s_bucket{%s,le="%s"} %d' % (
+                        name, labels, repr(bound), cumulative))
+                lines.append('%s_bucket{%s,le="+Inf"} %d' % (
+                    name, labels, histogram.count))
+                lines.append('%s_sum{%s} %s' % (
+                    name, labels, repr(histogram.sum)))
+                lines.append('%s_count{%s} %d' % (
+                    name, labels, histogram.count))
+        return '\n'.join(lines) + '\n'
+
+
+def _labels(job_id: Hashable, stats: JobStats) -> str:
+    return 'job="%s",func="%s"' % (
+        _escape(str(job_id)), _escape(stats.name))
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"')\
+        .replace('\n', '\\n')
@@ -0,0 +1,359 @@
+"""
+Sharding of jobs across worker processes, each running its own
+:class:`aioschedule.Scheduler` in its own event loop, so that a large
+number of jobs can use more than one core.
+
+Usage:
+    >>> from aioschedule.sharding import ShardedScheduler
+
+    >>> scheduler = ShardedScheduler(4)
+    >>> scheduler.every(10).seconds.with_id('device-1').do(poll, 'device-1')
+    >>> scheduler.add_many(
+    >>>     {'func': poll, 'unit': 'minutes', 'args': (device,), 'id': device}
+    >>>     for device in devices)
+    >>> scheduler.resize(8)
+    >>> scheduler.close()
+
+Job functions and their arguments are sent to the workers, so they must
+be picklable, e.g. functions defined at the top level of a module.
+"""
+import asyncio
+import bisect
+import datetime
+import hashlib
+import itertools
+import multiprocessing
+from typing import Any
+from typing import Hashable
+from typing import Iterable
+
+import aioschedule
+from aioschedule import Job
+
+
+#: Number of specs sent to a worker in one message by
+#: :meth:`ShardedScheduler.add_many`.
+CHUNK_SIZE = 10000
+
+
+def _hash(key: Hashable) -> int:
+    # A 64-bit hash of the repr of *key* that is the same in every
+    # process. CRC32, as used by Job.spread(), leaves the shards of the
+    # ring unbalanced by up to 15% because similar keys get similar
+    # checksums.
+    return int.from_bytes(
+        hashlib.blake2b(repr(key).encode(), digest_size=8).digest(), 'big')
+
+
+class HashRing(object):
+    """
+    Consistent hashing of job ids onto the shards ``0`` to
+    ``shards - 1``. Each shard owns *points* pseudo-random points of a
+    ring of hashes, and a job belongs to the shard owning the first
+    point after the hash of its id. When a shard is added, it only
+    takes jobs from the others, and when the last shard is removed,
+    only its jobs move.
+
+    :param shards: The number of shards.
+    :param points: The number of points per shard. More points
+                   balance the shards better.
+    """
+
+    def __init__(self, shards: int, points: int = 1000):
+        assert shards > 0
+        self.shards = shards
+        ring = sorted(
+            (_hash('%d/%d' % (shard, point)), shard)
+            for shard in range(shards) for point in range(points)
+        )
+        self._hashes = [hash_ for hash_, _ in ring]
+        self._shards = [shard for _, shard in ring]
+
+    def shard(self, key: Hashable) -> int:
+        """
+        :return: The shard that the job with id *key* belongs to.
+        """
+        index = bisect.bisect(self._hashes, _hash(key))
+        return self._shards[index % len(self._shards)]
+
+
+class ShardedScheduler(object):
+    """
+    Runs jobs in *shards* worker processes, spread by
+    :class:`HashRing` over their :attr:`Job.id`.
+
+    Jobs are created as with a :class:`aioschedule.Scheduler`, with
+    :meth:`every`, :meth:`cron` and :meth:`add_many`, and sent to the
+    worker of their shard by :meth:`Job.do`; jobs without an id get a
+    number. The returned jobs describe what was sent: they do not
+    follow the runs of the job in the worker, and cannot be run in the
+    parent process: :meth:`Job.run` raises :exc:`RuntimeError`.
+    :meth:`Job.tag` and assigning :attr:`Job.next_run` are forwarded to
+    the worker.
+
+    :param shards: The number of worker processes.
+    :param start_method: The :mod:`multiprocessing` start method of the
+                         workers, e.g. ``'fork'`` or ``'spawn'``.
+                         Defaults to the one of the platform.
+    """
+    clock: aioschedule.Clock
+    ring: HashRing
+    jobstore = None  # jobs are never stored, see Job.tag()
+
+    def __init__(self, shards: int, start_method: str | None = None):
+        self.clock = aioschedule.Clock()
+        self.ring = HashRing(shards)
+        self._context = multiprocessing.get_context(start_method)
+        self._workers: list[tuple[Any, Any]] = []  # (process, connection)
+        self._ids = itertools.count(1)
+        self._names: dict[Any, str] = {}  # see Job._record()
+        self._phases: dict[int, int] = {}  # see _next_phase()
+        for shard in range(shards):
+            self._spawn(shard)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
+
+    def every(self, interval: int = 1) -> Job:
+        """
+        Like :meth:`aioschedule.Scheduler.every`.
+        """
+        return Job(interval, self)
+
+    def cron(self, expression: str,
+             tz: datetime.tzinfo | str | None = None) -> Job:
+        """
+        Like :meth:`aioschedule.Scheduler.cron`.
+        """
+        job = Job(1, self)
+        job.cron = aioschedule._crontab.parse(expression)
+        job.tz = None if tz is None else aioschedule._zone(tz)
+        return job
+
+    def add_many(self, specs: Iterable[dict[str, Any]]) -> list[Hashable]:
+        """
+        Like :meth:`aioschedule.Scheduler.add_many`. The workers add
+        their part of the jobs in parallel. All specs are checked before
+        any is sent, so an invalid spec adds no jobs.
+
+        :return: The ids of the jobs
+        """
+        shards: list[list[dict[str, Any]]] = [[] for _ in self._workers]
+        ids = []
+        periods: dict[tuple[int, str], int] = {}
+        for spec in specs:
+            aioschedule._check_spec(spec, periods)
+            if spec.get('id') is None:
+                spec = dict(spec, id=next(self._ids))
+            ids.append(spec['id'])
+            shards[self.ring.shard(spec['id'])].append(spec)
+        for offset in range(0, max(map(len, shards)), CHUNK_SIZE):
+            self._call_all('add_many', [
+                (specs[offset:offset + CHUNK_SIZE],) for specs in shards])
+        return ids
+
+    def cancel_job(self, job: Job | Hashable):
+        """
+        Delete a scheduled job.
+
+        :param job: The job to be unscheduled, or its id
+        """
+        if isinstance(job, Job):
+            job._registered = False
+            job = job.id
+        self._call(self.ring.shard(job), 'cancel_job', job)
+
+    def clear(self, tag: Hashable | None = None):
+        """
+        Like :meth:`aioschedule.Scheduler.clear`, in all workers.
+        """
+        self._call_all('clear', [(tag,)] * len(self._workers))
+
+    def job_counts(self) -> list[int]:
+        """
+        :return: The number of jobs of each shard.
+        """
+        return self._call_all('count', [()] * len(self._workers))
+
+    def resize(self, shards: int) -> int:
+        """
+        Change the number of worker processes. The jobs whose shard
+        changed are moved, keeping their next run, which is about one
+        in *shards* jobs when adding a worker.
+
+        :return: The number of jobs that moved
+        """
+        assert shards > 0
+        before = len(self._workers)
+        for shard in range(before, shards):
+            self._spawn(shard)
+        exported = self._call_all('export', [(shards,)] * before,
+            self._workers[:before])
+        self.ring = ring = HashRing(shards)
+        moved: list[list[dict[str, Any]]] = [[] for _ in range(shards)]
+        for records in exported:
+            for record in records:
+                moved[ring.shard(record['id'])].append(record)
+        for process, connection in self._workers[shards:]:
+            self._stop(process, connection)
+        del self._workers[shards:]
+        self._call_all('add', [(records,) for records in moved])
+        return sum(map(len, moved))
+
+    def close(self):
+        """
+        Stop the worker processes. Jobs that are running are cancelled.
+        """
+        for process, connection in self._workers:
+            self._stop(process, connection)
+        self._workers.clear()
+
+    def _spawn(self, shard: int):
+        connection, child = self._context.Pipe()
+        process = self._context.Process(target=_work,
+            args=(child, shard), name='aioschedule-shard-%d' % shard,
+            daemon=True)
+        process.start()
+        child.close()
+        self._workers.append((process, connection))
+
+    def _stop(self, process: Any, connection: Any):
+        connection.send(('stop',))
+        _reply(connection)
+        connection.close()
+        process.join()
+
+    def _call(self, shard: int, command: str, *args: Any) -> Any:
+        connection = self._workers[shard][1]
+        connection.send((command,) + args)
+        return _reply(connection)
+
+    def _call_all(self, command: str, args: list[tuple[Any, ...]],
+                  workers: list[tuple[Any, Any]] | None = None) -> list[Any]:
+        # Send *command* to all workers before waiting for their replies,
+        # so that they execute it in parallel.
+        workers = self._workers if workers is None else workers
+        for (_, connection), arguments in zip(workers, args):
+            connection.send((command,) + arguments)
+        # Read every reply before raising an error, or the replies left
+        # in the pipes would answer the next commands.
+        replies = [connection.recv() for _, connection in workers]
+        for status, value in replies:
+            if status == 'error':
+                raise value
+        return [value for _, value in replies]
+
+    # The interface of aioschedule.Scheduler used by Job.
+
+    def _add_job(self, job: Job):
+        if job.id is None:
+            job.id = next(self._ids)
+        job._registered = True
+        self._call(self.ring.shard(job.id), 'add', [job._record()])
+
+    def _enqueue(self, job: Job):
+        self._call(self.ring.shard(job.id), 'set_next_run', job.id,
+            job.next_run)
+
+    def _tag(self, job: Job, tag: Hashable):
+        self._call(self.ring.shard(job.id), 'tag', job.id, tag)
+
+    def _stored(self, job: Job) -> bool:
+        return False
+
+    _next_phase = aioschedule.Scheduler._next_phase
+
+
+def _reply(connection: Any) -> Any:
+    status, value = connection.recv()
+    if status == 'error':
+        raise value
+    return value
+
+
+class _Worker(object):
+    # Executes the commands of a ShardedScheduler in a worker process.
+
+    def __init__(self, shard: int):
+        self.shard = shard
+        self.scheduler = aioschedule.Scheduler()
+        self.stopped = asyncio.get_running_loop().create_future()
+
+    def add(self, records: list[dict[str, Any]]):
+        scheduler = self.scheduler
+        scheduler._adopt([Job._restore(record, record['func'], scheduler)
+                          for record in records])
+
+    def add_many(self, specs: list[dict[str, Any]]):
+        self.scheduler.add_many(specs)
+
+    def cancel_job(self, job_id: Hashable):
+        job = self.scheduler.get_job(job_id)
+        if job is not None:
+            self.scheduler.cancel_job(job)
+
+    def clear(self, tag: Hashable | None):
+        self.scheduler.clear(tag)
+
+    def count(self) -> int:
+        return len(self.scheduler.jobs)
+
+    def tag(self, job_id: Hashable, tag: Hashable):
+        job = self.scheduler.get_job(job_id)
+        if job is not None:
+            job.tag(tag)
+
+    def set_next_run(self, job_id: Hashable, next_run: datetime.datetime):
+        job = self.scheduler.get_job(job_id)
+        if job is not None:
+            job.next_run = next_run
+
+    def export(self, shards: int) -> list[dict[str, Any]]:
+        # Remove and return the jobs that belong to another shard once
+        # there are *shards* shards.
+        ring = HashRing(shards)
+        records = []
+        for job in list(self.scheduler.jobs):
+            if ring.shard(job.id) != self.shard:
+                records.append(job._record())
+                self.scheduler.cancel_job(job)
+        return records
+
+    def stop(self):
+        self.stopped.set_result(None)
+
+
+def _work(connection: Any, shard: int):
+    # Entry point of a worker process.
+    asyncio.run(_serve(connection, shard))
+
+
+async def _serve(connection: Any, shard: int):
+    loop = asyncio.get_running_loop()
+    worker = _Worker(shard)
+
+    def receive():
+        while not worker.stopped.done() and connection.poll():
+            try:
+                command, *args = connection.recv()
+            except EOFError:  # the parent process exited
+                worker.stopped.set_result(None)
+                return
+            try:
+                reply = ('ok', getattr(worker, command)(*args))
+            except Exception as exception:
+                reply = ('error', exception)
+            connection.send(reply)
+
+    loop.add_reader(connection.fileno(), receive)
+    server = asyncio.create_task(worker.scheduler.run_forever())
+    try:
+        await worker.stopped
+    finally:
+        loop.remove_reader(connection.fileno())
+        server.cancel()
+        await asyncio.gather(server, return_exceptions=True)
+        worker.scheduler.shutdown(wait=False)
@@ -0,0 +1,60 @@
+"""Run the benchmarks and print the results as JSON.
+
+Usage: ``python -m benchmarks [--sizes 1000,10000] [--output FILE]``.
+The output contains the environment and a list of results, so that
+runs against different versions can be compared.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from . import memory
+from . import scheduler
+
+
+def main(argv: list[str]):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('--sizes', default='1000,10000,100000,1000000',
+        help="comma-separated numbers of registered jobs")
+    parser.add_argument('--only', action='append', default=[],
+        help="run only the named benchmark; may be repeated")
+    parser.add_argument('--output', help="write the results to this file")
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(',')]
+    if min(sizes) < scheduler.MIN_JOBS:
+        parser.error('sizes must be at least %d' % scheduler.MIN_JOBS)
+
+    results = []
+    for njobs in sizes:
+        for benchmark in scheduler.BENCHMARKS:
+            if args.only and benchmark.__name__ not in args.only:
+                continue
+            print('%s: %d jobs' % (benchmark.__name__, njobs),
+                file=sys.stderr)
+            results.extend(benchmark(njobs))
+        if not args.only or 'memory' in args.only:
+            results.append(scheduler.result('memory', njobs,
+                memory.bytes_per_job(njobs), 'bytes/job'))
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with open(os.path.join(root, 'VERSION')) as f:
+        version = f.read().strip()
+    report = json.dumps({
+        'version': version,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': int(time.time()),
+        'results': results,
+    }, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report + '\n')
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
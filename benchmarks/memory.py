@@ -0,0 +1,41 @@
+"""Measure the memory used per registered job with :mod:`tracemalloc`.
+
+Run with ``python -m benchmarks.memory [njobs]``.
+"""
+import datetime
+import sys
+import tracemalloc
+
+import aioschedule
+
+
+async def job(n: int):
+    pass
+
+
+def bytes_per_job(njobs: int) -> float:
+    """
+    Return the number of bytes allocated per job when registering
+    *njobs* interval jobs, each with one argument and one tag.
+    """
+    clock = aioschedule.FakeClock(datetime.datetime(2020, 1, 1))
+    scheduler = aioschedule.Scheduler(clock=clock)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for n in range(njobs):
+            scheduler.every(10).seconds.do(job, n).tag('memory')
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    allocated = sum(s.size_diff for s in after.compare_to(before, 'filename'))
+    return allocated / njobs
+
+
+def main(argv: list[str]):
+    njobs = int(argv[0]) if argv else 100000
+    print('%d jobs: %.0f bytes per job' % (njobs, bytes_per_job(njobs)))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,360 @@
+"""Benchmarks of the :class:`aioschedule.Scheduler` hot paths.
+
+All benchmarks except :func:`jitter` run against a
+:class:`aioschedule.FakeClock`, so that the amount of work done does
+not depend on the speed of the machine.
+"""
+import asyncio
+import datetime
+import io
+import logging
+import os
+import statistics
+import tempfile
+import time
+import zoneinfo
+from typing import Any
+from typing import Callable
+
+import aioschedule
+from aioschedule.crontab import CronExpression
+from aioschedule.jobstore import SQLiteJobStore
+from aioschedule.locks import SQLiteLockBackend
+
+
+#: Number of jobs that share a tag in :func:`clear_tag`.
+TAG_SIZE = 100
+
+#: Number of due jobs in :func:`run_pending`.
+DUE_JOBS = 100
+
+#: Smallest number of jobs the benchmarks can be run with: one tag in
+#: :func:`cancel`.
+MIN_JOBS = TAG_SIZE
+
+#: Expressions measured by :func:`cron`, from dense to sparse.
+CRON_EXPRESSIONS = {
+    'every_minute': '* * * * *',
+    'business_hours': '*/5 9-17 * * 1-5',
+    'yearly': '59 23 31 12 *',
+    'leap_day': '0 0 29 2 *',
+}
+
+
+async def noop(*args: Any):
+    pass
+
+
+def new_scheduler() -> aioschedule.Scheduler:
+    clock = aioschedule.FakeClock(datetime.datetime(2020, 1, 1))
+    return aioschedule.Scheduler(clock=clock)
+
+
+def populate(scheduler: aioschedule.Scheduler, njobs: int):
+    """Register *njobs* jobs that run every hour, tagged in groups."""
+    for n in range(njobs):
+        scheduler.every(3600).seconds.do(noop, n).tag(n // TAG_SIZE)
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """Return the median duration of *func* in nanoseconds."""
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter_ns()
+        func()
+        timings.append(time.perf_counter_ns() - t0)
+    return statistics.median(timings)
+
+
+def result(name: str, njobs: int | None, value: float, unit: str) -> dict:
+    return {'name': name, 'jobs': njobs, 'value': value, 'unit': unit}
+
+
+def register(njobs: int) -> list[dict]:
+    """Throughput of :meth:`aioschedule.Job.do`."""
+    scheduler = new_scheduler()
+    t0 = time.perf_counter_ns()
+    populate(scheduler, njobs)
+    elapsed = time.perf_counter_ns() - t0
+    return [result('register', njobs, njobs / elapsed * 1e9, 'jobs/s')]
+
+
+def add_many(njobs: int) -> list[dict]:
+    """Startup time of *njobs* jobs registered one by one with
+    :meth:`aioschedule.Job.do`, and in bulk with
+    :meth:`aioschedule.Scheduler.add_many`."""
+    specs = [
+        {'func': noop, 'interval': 3600, 'unit': 'seconds', 'args': (n,),
+         'tags': (n // TAG_SIZE,)}
+        for n in range(njobs)
+    ]
+    return [
+        result('startup.do', njobs,
+            measure(lambda: populate(new_scheduler(), njobs), 3), 'ns'),
+        result('startup.add_many', njobs,
+            measure(lambda: new_scheduler().add_many(specs), 3), 'ns'),
+    ]
+
+
+def spread(njobs: int) -> list[dict]:
+    """Peak number of runs per second of *njobs* jobs that run every
+    minute and are created at once, without and with
+    :meth:`aioschedule.Job.spread`."""
+    results = []
+    for name, spread_jobs in (('none', False), ('even', True)):
+        scheduler = new_scheduler()
+        scheduler.add_many(
+            {'func': noop, 'unit': 'minutes', 'spread': spread_jobs}
+            for _ in range(njobs))
+        seconds: dict[int, int] = {}
+        for job in scheduler.jobs:
+            second = int(job._due // 10**9)
+            seconds[second] = seconds.get(second, 0) + 1
+        results.append(result('spread.peak_%s' % name, njobs,
+            max(seconds.values()), 'runs/s'))
+    return results
+
+
+def run_pending(njobs: int) -> list[dict]:
+    """Latency of :meth:`aioschedule.Scheduler.run_pending`."""
+    scheduler = new_scheduler()
+    populate(scheduler, njobs)
+    loop = asyncio.new_event_loop()
+    try:
+        idle = measure(
+            lambda: loop.run_until_complete(scheduler.run_pending()), 50)
+        for n in range(DUE_JOBS):
+            scheduler.every().second.do(noop, n)
+
+        def tick():
+            scheduler.clock.advance(1)
+            loop.run_until_complete(scheduler.run_pending())
+
+        busy = measure(tick, 50)
+    finally:
+        loop.close()
+    return [
+        result('run_pending.none_due', njobs, idle, 'ns'),
+        result('run_pending.%d_due' % DUE_JOBS, njobs, busy, 'ns'),
+    ]
+
+
+def cancel(njobs: int) -> list[dict]:
+    """Cost of :meth:`aioschedule.Scheduler.cancel_job` and
+    :meth:`aioschedule.Scheduler.clear` with a tag."""
+    assert njobs >= MIN_JOBS
+    scheduler = new_scheduler()
+    populate(scheduler, njobs)
+    # Every measurement cancels another job and clears another tag.
+    ntags = njobs // TAG_SIZE
+    cancels, clears = min(100, njobs), min(5, ntags)
+    jobs = iter(list(scheduler.jobs)[::max(njobs // 1000, 1)])
+    tags = iter(range(0, ntags, 2 if ntags >= 2 * clears else 1))
+    return [
+        result('cancel_job', njobs,
+            measure(lambda: scheduler.cancel_job(next(jobs)), cancels), 'ns'),
+        result('clear_tag', njobs,
+            measure(lambda: scheduler.clear(next(tags)), clears), 'ns'),
+    ]
+
+
+def next_run(njobs: int) -> list[dict]:
+    """Cost of reading :attr:`aioschedule.Scheduler.next_run` and
+    :attr:`aioschedule.Scheduler.idle_seconds`."""
+    scheduler = new_scheduler()
+    populate(scheduler, njobs)
+    return [
+        result('next_run', njobs,
+            measure(lambda: scheduler.next_run, 20), 'ns'),
+        result('idle_seconds', njobs,
+            measure(lambda: scheduler.idle_seconds, 20), 'ns'),
+    ]
+
+
+def jitter(njobs: int, duration: float = 1.0) -> list[dict]:
+    """Lateness of a job firing every 10 ms under
+    :meth:`aioschedule.Scheduler.run_forever`, with *njobs* other jobs
+    registered and 100 of them busy every second. Uses the system
+    clock, so the results depend on the machine.
+    """
+    scheduler = aioschedule.Scheduler()
+    populate(scheduler, njobs)
+    lateness: list[float] = []
+
+    async def probe():
+        lateness.append(
+            (scheduler.clock.monotonic_ns() - probe_job._due) / 1000)
+
+    async def load():
+        sum(range(1000))
+
+    async def main():
+        for n in range(DUE_JOBS):
+            scheduler.every().second.do(load)
+        server = asyncio.create_task(scheduler.run_forever())
+        await asyncio.sleep(duration)
+        server.cancel()
+        await asyncio.gather(server, return_exceptions=True)
+
+    # Job.run() reschedules the job after the probe recorded its
+    # lateness, so _due still holds the time it was due at.
+    probe_job = scheduler.every(0.01).seconds.do(probe)
+    asyncio.run(main())
+    lateness.sort()
+    return [
+        result('jitter.p50', njobs, lateness[len(lateness) // 2], 'us'),
+        result('jitter.p99', njobs, lateness[len(lateness) * 99 // 100], 'us'),
+    ]
+
+
+def log_overhead(njobs: int) -> list[dict]:
+    """Cost per firing of the ``Running job`` log record, for jobs
+    with a large argument, with INFO logging disabled, enabled and
+    enabled with 1% sampling. *njobs* jobs are fired per measurement.
+    """
+    logger = logging.getLogger('schedule')
+    handler = logging.StreamHandler(io.StringIO())
+    level, propagate = logger.level, logger.propagate
+    payload = list(range(100))
+    results = []
+    modes = [('off', logging.WARNING, 1.0), ('info', logging.INFO, 1.0),
+             ('info_sampled', logging.INFO, 0.01)]
+    logger.addHandler(handler)
+    logger.propagate = False
+    loop = asyncio.new_event_loop()
+    try:
+        for mode, log_level, sample_rate in modes:
+            logger.setLevel(log_level)
+            scheduler = new_scheduler()
+            scheduler.log_sample_rate = sample_rate
+            for n in range(njobs):
+                scheduler.every().second.do(noop, payload)
+
+            def tick():
+                scheduler.clock.advance(1)
+                loop.run_until_complete(scheduler.run_pending())
+
+            results.append(result('log_overhead.%s' % mode, njobs,
+                measure(tick, 5) / njobs, 'ns/firing'))
+    finally:
+        loop.close()
+        logger.removeHandler(handler)
+        logger.setLevel(level)
+        logger.propagate = propagate
+    return results
+
+
+def jobstore(njobs: int) -> list[dict]:
+    """Duration of the :meth:`aioschedule.Scheduler.checkpoint` after
+    :data:`DUE_JOBS` jobs ran, and time to
+    :meth:`aioschedule.Scheduler.restore` *njobs* jobs from a
+    :class:`aioschedule.jobstore.SQLiteJobStore` file."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'jobs.db')
+        store = SQLiteJobStore(path)
+        scheduler = new_scheduler()
+        scheduler.jobstore = store
+        scheduler.register(noop, 'noop')
+        populate(scheduler, njobs)
+        for n in range(DUE_JOBS):
+            scheduler.every().second.do(noop, n)
+        scheduler.checkpoint()
+        checkpoints: list[float] = []
+        loop = asyncio.new_event_loop()
+        try:
+            for _ in range(20):
+                scheduler.clock.advance(1)
+                store.flush = lambda: None  # measured below
+                loop.run_until_complete(scheduler.run_pending())
+                del store.flush
+                checkpoints.append(measure(store.flush, 1))
+        finally:
+            loop.close()
+        store.close()
+
+        def restart():
+            restarted = new_scheduler()
+            restarted.jobstore = SQLiteJobStore(path)
+            restarted.register(noop, 'noop')
+            restarted.restore()
+            restarted.jobstore.close()
+
+        return [
+            result('jobstore.checkpoint_%d' % DUE_JOBS, njobs,
+                statistics.median(checkpoints), 'ns'),
+            result('jobstore.restore', njobs, measure(restart, 3), 'ns'),
+        ]
+
+
+def cron(njobs: int) -> list[dict]:
+    """Cost of :meth:`aioschedule.crontab.CronExpression.next_fire`
+    for expressions of different density, and throughput of
+    registering *njobs* jobs with :meth:`aioschedule.Scheduler.cron`."""
+    results = []
+    after = datetime.datetime(2020, 3, 1, 17, 56, 30)
+    for name, expression in CRON_EXPRESSIONS.items():
+        compiled = CronExpression(expression)
+        results.append(result('cron.next_fire.%s' % name, None,
+            measure(lambda: compiled.next_fire(after), 1000), 'ns'))
+    scheduler = new_scheduler()
+    t0 = time.perf_counter_ns()
+    for n in range(njobs):
+        scheduler.cron('*/5 9-17 * * 1-5').do(noop, n)
+    elapsed = time.perf_counter_ns() - t0
+    results.append(result('cron.register', njobs, njobs / elapsed * 1e9,
+        'jobs/s'))
+    return results
+
+
+def timezones(njobs: int, nzones: int = 100) -> list[dict]:
+    """Throughput of registering *njobs* daily jobs with
+    :meth:`aioschedule.Job.at`, at one of 24 full hours, in local time
+    and spread over *nzones* time zones."""
+    zones = sorted(zoneinfo.available_timezones())[:nzones]
+    results = []
+    for name, tzs in (('local', [None]), ('zones', zones)):
+        scheduler = new_scheduler()
+        t0 = time.perf_counter_ns()
+        for n in range(njobs):
+            scheduler.every().day.at('%02d:00' % (n % 24),
+                tz=tzs[n % len(tzs)]).do(noop, n)
+        elapsed = time.perf_counter_ns() - t0
+        results.append(result('timezones.register_%s' % name, njobs,
+            njobs / elapsed * 1e9, 'jobs/s'))
+    return results
+
+
+def locks(njobs: int) -> list[dict]:
+    """Cost per firing of taking the lease of the occurrence with a
+    :class:`aioschedule.locks.SQLiteLockBackend`, for *njobs* jobs that
+    all fire in the same tick, in the replica that wins the leases and
+    in one that loses them."""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'locks.db')
+        loop = asyncio.new_event_loop()
+        try:
+            for name in ('none', 'won', 'lost'):
+                scheduler = new_scheduler()
+                if name != 'none':
+                    scheduler.lock_backend = SQLiteLockBackend(path)
+                for n in range(njobs):
+                    scheduler.every().second.with_id(n).do(noop)
+
+                def tick():
+                    scheduler.clock.advance(1)
+                    loop.run_until_complete(scheduler.run_pending())
+
+                results.append(result('locks.%s' % name, njobs,
+                    measure(tick, 5) / njobs, 'ns/firing'))
+                if name != 'none':
+                    scheduler.lock_backend.close()
+        finally:
+            loop.close()
+    return results
+
+
+BENCHMARKS = [
+    register, add_many, spread, run_pending, cancel, next_run, jitter,
+    log_overhead, jobstore, cron, timezones, locks
+]
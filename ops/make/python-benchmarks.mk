@@ -0,0 +1,8 @@
+# Scheduler benchmarks, see benchmarks/__main__.py. Pass BENCHMARK_ARGS
+# to select sizes or benchmarks, e.g. BENCHMARK_ARGS="--sizes 1000".
+cmd.benchmark ?= $(PYTHON) -m benchmarks
+benchmark.output ?= benchmarks.json
+
+
+benchmark:
+	@$(cmd.benchmark) --output $(benchmark.output) $(BENCHMARK_ARGS)
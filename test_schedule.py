@@ -3,8 +3,14 @@
 import asyncio
 import datetime
 import functools
+import logging
 import mock
+import os
+import tempfile
+import threading
+import time
 import unittest
+import zoneinfo
 
 # Silence "missing docstring", "method could be a function",
 # "class already defined", and "too many public methods" messages:
@@ -12,6 +18,13 @@ import unittest
 
 import aioschedule as schedule
 from aioschedule import every
+from aioschedule.crontab import CronExpression
+from aioschedule.jobstore import SQLiteJobStore
+from aioschedule.locks import SQLiteLockBackend
+from aioschedule.metrics import Histogram
+from aioschedule.metrics import JobMetrics
+from aioschedule.sharding import HashRing
+from aioschedule.sharding import ShardedScheduler
 
 
 def make_mock_job(name=None):
@@ -39,42 +52,45 @@ class Mock:
 
 class mock_datetime(object):
     """
-    Monkey-patch datetime for predictable results
+    Move the clock of the default scheduler to a fixed time for
+    predictable results. Consecutive uses within a test move the
+    same :class:`aioschedule.FakeClock` forward.
     """
     def __init__(self, year, month, day, hour, minute):
-        self.year = year
-        self.month = month
-        self.day = day
-        self.hour = hour
-        self.minute = minute
+        self.now = datetime.datetime(year, month, day, hour, minute)
 
     def __enter__(self):
-        class MockDate(datetime.datetime):
-            @classmethod
-            def today(cls):
-                return cls(self.year, self.month, self.day)
-
-            @classmethod
-            def now(cls):
-                return cls(self.year, self.month, self.day,
-                           self.hour, self.minute)
-        self.original_datetime = datetime.datetime
-        datetime.datetime = MockDate
+        clock = schedule.default_scheduler.clock
+        if isinstance(clock, schedule.FakeClock):
+            clock.set(self.now)
+        else:
+            schedule.default_scheduler.clock = schedule.FakeClock(self.now)
 
     def __exit__(self, *args, **kwargs):
-        datetime.datetime = self.original_datetime
+        pass
 
 
-class SchedulerTests(unittest.TestCase):
-    def setUp(self):
-        schedule.clear()
-
+class AsyncTestCase(unittest.TestCase):
     def run_async(self, func, *args, **kwargs):
         loop = asyncio.get_event_loop()
         fut = asyncio.ensure_future(func(*args, **kwargs))
         loop.run_until_complete(fut)
         return fut.result()
 
+
+class TempDirMixin(object):
+    # Gives every test an empty temporary directory, self.tmp.
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+
+class SchedulerTests(AsyncTestCase):
+    def setUp(self):
+        schedule.clear()
+        schedule.default_scheduler.clock = schedule.Clock()
+
     def test_time_units(self):
         assert every().seconds.unit == 'seconds'
         assert every().minutes.unit == 'minutes'
@@ -286,6 +302,19 @@ class SchedulerTests(unittest.TestCase):
             assert schedule.next_run() == original_datetime(2010, 1, 6, 14, 16)
             assert schedule.idle_seconds() == 60 * 60
 
+    def test_next_run_follows_queue_changes(self):
+        with mock_datetime(2010, 1, 6, 13, 16):
+            assert schedule.idle_seconds() is None
+            hourly = every().hour.do(make_mock_job('hourly'))
+            minutely = every().minute.do(make_mock_job('minutely'))
+            assert schedule.idle_seconds() == 60
+            schedule.cancel_job(minutely)
+            assert schedule.next_run() == datetime.datetime(2010, 1, 6, 14, 16)
+            hourly.next_run = datetime.datetime(2010, 1, 6, 13, 30)
+            assert schedule.idle_seconds() == 14 * 60
+            schedule.cancel_job(hourly)
+            assert schedule.next_run() is None
+
     def test_cancel_job(self):
         async def stop_job():
             return schedule.CancelJob
@@ -319,6 +348,41 @@ class SchedulerTests(unittest.TestCase):
         self.run_async(schedule.run_all)
         assert len(schedule.jobs) == 0
 
+    def test_cancel_job_from_run_pending(self):
+        async def stop_job():
+            return schedule.CancelJob
+
+        with mock_datetime(2010, 1, 6, 12, 15):
+            job = every().minute.do(stop_job)
+        with mock_datetime(2010, 1, 6, 12, 16):
+            self.run_async(schedule.run_pending)
+        assert job not in schedule.jobs
+        assert schedule.next_run() is None
+
+    def test_times(self):
+        mock_job = make_mock_job()
+        with mock_datetime(2010, 1, 6, 12, 15):
+            job = every().minute.times(2).do(mock_job)
+        for minute in (16, 17, 18):
+            with mock_datetime(2010, 1, 6, 12, minute):
+                self.run_async(schedule.run_pending)
+        assert mock_job.call_count == 2
+        assert job not in schedule.jobs
+
+    def test_until(self):
+        mock_job = make_mock_job()
+        with mock_datetime(2010, 1, 6, 12, 15):
+            job = every().minute.until(
+                datetime.datetime(2010, 1, 6, 12, 17)).do(mock_job)
+            expired = every().hour.until(
+                datetime.datetime(2010, 1, 6, 12, 30)).do(mock_job)
+        assert expired not in schedule.jobs
+        for minute in (16, 17, 18):
+            with mock_datetime(2010, 1, 6, 12, minute):
+                self.run_async(schedule.run_pending)
+        assert mock_job.call_count == 2
+        assert job not in schedule.jobs
+
     def test_tag_type_enforcement(self):
         job1 = every().second.do(make_mock_job(name='job1'))
         self.assertRaises(TypeError, job1.tag, {})
@@ -344,6 +408,645 @@ class SchedulerTests(unittest.TestCase):
         schedule.clear()
         assert len(schedule.jobs) == 0
 
+    def test_run_pending_skips_cancelled_jobs(self):
+        mock_job = make_mock_job()
+        with mock_datetime(2010, 1, 6, 12, 15):
+            job = every().minute.do(mock_job)
+            every().minute.do(mock_job)
+            schedule.cancel_job(job)
+
+        with mock_datetime(2010, 1, 6, 12, 16):
+            self.run_async(schedule.run_pending)
+            assert mock_job.call_count == 1
+
+    def test_run_pending_requeues_job_at_next_run(self):
+        mock_job = make_mock_job()
+        with mock_datetime(2010, 1, 6, 12, 15):
+            job = every().minute.do(mock_job)
+            job.next_run = datetime.datetime(2010, 1, 6, 12, 20)
+
+        with mock_datetime(2010, 1, 6, 12, 16):
+            self.run_async(schedule.run_pending)
+            assert mock_job.call_count == 0
+
+        with mock_datetime(2010, 1, 6, 12, 20):
+            self.run_async(schedule.run_pending)
+            self.run_async(schedule.run_pending)
+            assert mock_job.call_count == 1
+            assert job.next_run == datetime.datetime(2010, 1, 6, 12, 21)
+
+    def test_failing_job_is_rescheduled(self):
+        async def failing_job():
+            raise ValueError
+
+        with mock_datetime(2010, 1, 6, 12, 15):
+            job = every().minute.do(failing_job)
+
+        with mock_datetime(2010, 1, 6, 12, 16):
+            done, _ = self.run_async(schedule.run_pending)
+            assert isinstance(done.pop().exception(), ValueError)
+            assert not job.should_run
+            assert job.next_run == datetime.datetime(2010, 1, 6, 12, 17)
+
+    def test_run_forever_wakes_up_when_job_is_added(self):
+        async def main():
+            scheduler = schedule.Scheduler()
+            called = asyncio.Event()
+
+            async def job():
+                called.set()
+
+            server = asyncio.create_task(scheduler.run_forever())
+            await asyncio.sleep(0)
+            job = scheduler.every().hour.do(job)
+            job.next_run = datetime.datetime.now()
+            await asyncio.wait_for(called.wait(), 1)
+            server.cancel()
+            await asyncio.gather(server, return_exceptions=True)
+            return job
+
+        job = self.run_async(main)
+        assert job.next_run > datetime.datetime.now()
+
+    def test_run_forever_sleeps_until_next_run(self):
+        async def main():
+            scheduler = schedule.Scheduler()
+            server = asyncio.create_task(scheduler.run_forever())
+            scheduler.every().hour.do(make_mock_job())
+            await asyncio.sleep(0.01)
+            server.cancel()
+            await asyncio.gather(server, return_exceptions=True)
+            return scheduler._sleep_time()
+
+        assert self.run_async(main) > 3590
+
+    def test_run_forever_stops_when_cancelled_as_it_wakes_up(self):
+        async def main():
+            scheduler = schedule.Scheduler()
+            scheduler.every().hour.do(make_mock_job())
+            server = asyncio.create_task(scheduler.run_forever())
+            await asyncio.sleep(0)
+            # Wake it up and cancel it in the same loop iteration.
+            scheduler.every().minute.do(make_mock_job())
+            server.cancel()
+            done, _ = await asyncio.wait([server], timeout=1)
+            return done
+
+        assert self.run_async(main)
+
+    def test_start_runs_jobs_from_loop_timers(self):
+        async def main():
+            scheduler = schedule.Scheduler()
+            called = asyncio.Event()
+
+            async def job():
+                called.set()
+
+            scheduler.start()
+            job = scheduler.every().hour.do(job)
+            job.next_run = datetime.datetime.now()
+            await asyncio.wait_for(called.wait(), 1)
+            await asyncio.sleep(0)
+            assert job._due in scheduler._timers
+            scheduler.stop()
+            assert not scheduler._timers
+
+        self.run_async(main)
+
+    def test_start_twice_raises(self):
+        async def main():
+            scheduler = schedule.Scheduler()
+            scheduler.start()
+            try:
+                self.assertRaises(RuntimeError, scheduler.start)
+            finally:
+                scheduler.stop()
+
+        self.run_async(main)
+
+    def test_interval_job_ignores_wall_clock_steps(self):
+        clock = schedule.FakeClock(datetime.datetime(2010, 1, 6, 12, 15))
+        scheduler = schedule.Scheduler(clock=clock)
+        mock_job = make_mock_job()
+        job = scheduler.every(10).seconds.do(mock_job)
+
+        clock.step(-3600)
+        clock.advance(10)
+        assert job.should_run
+        self.run_async(scheduler.run_pending)
+        assert mock_job.call_count == 1
+
+        clock.step(3600)
+        assert not job.should_run
+
+    def test_at_time_job_follows_wall_clock(self):
+        clock = schedule.FakeClock(datetime.datetime(2010, 1, 6, 12, 15))
+        scheduler = schedule.Scheduler(clock=clock)
+        job = scheduler.every().day.at('12:30').do(make_mock_job())
+        assert job.next_run == datetime.datetime(2010, 1, 6, 12, 30)
+        clock.advance(15 * 60 - 1)
+        assert not job.should_run
+        clock.advance(1)
+        assert job.should_run
+
+    def test_at_time_across_local_dst_change(self):
+        tz = os.environ.get('TZ')
+        os.environ['TZ'] = 'America/New_York'
+        time.tzset()
+        try:
+            new_york = zoneinfo.ZoneInfo('America/New_York')
+            # The clocks go forward in the night after.
+            clock = schedule.FakeClock(datetime.datetime(2021, 3, 13, 12, 0,
+                                                         tzinfo=new_york))
+            scheduler = schedule.Scheduler(clock=clock)
+            job = scheduler.every().day.at('10:30').do(make_mock_job())
+            assert job.next_run == datetime.datetime(2021, 3, 14, 10, 30)
+            # 22:30 on the wall clock, 21:30 in real time.
+            clock.advance(21.5 * 3600 - 1)
+            assert not job.should_run
+            clock.advance(1)
+            assert job.should_run
+            assert clock.now() == datetime.datetime(2021, 3, 14, 10, 30)
+        finally:
+            if tz is None:
+                del os.environ['TZ']
+            else:
+                os.environ['TZ'] = tz
+            time.tzset()
+
+    def test_at_time_zone(self):
+        utc = datetime.timezone.utc
+        new_york = zoneinfo.ZoneInfo('America/New_York')
+        # 07:00 in New York, the day before the clocks go forward.
+        clock = schedule.FakeClock(datetime.datetime(2021, 3, 13, 12, 0,
+                                                     tzinfo=utc))
+        scheduler = schedule.Scheduler(clock=clock)
+        mock_job = make_mock_job()
+        job = scheduler.every().day.at('02:30', tz=new_york).do(mock_job)
+        tokyo = scheduler.every().day.at('09:00', tz='Asia/Tokyo') \
+            .do(mock_job)
+
+        # 02:30 does not exist on March 14, the job runs at 03:30 EDT.
+        assert job.next_run == datetime.datetime(2021, 3, 14, 3, 30,
+                                                 tzinfo=new_york)
+        assert job.next_run.utcoffset() == datetime.timedelta(hours=-4)
+        assert tokyo.next_run == datetime.datetime(2021, 3, 14, 0, 0,
+                                                   tzinfo=utc)
+        assert scheduler.next_run == tokyo.next_run
+        assert scheduler.idle_seconds == 12 * 3600
+
+        clock.advance(19.5 * 3600)
+        self.run_async(scheduler.run_pending)
+        assert mock_job.call_count == 2
+        assert job.next_run == datetime.datetime(2021, 3, 15, 6, 30,
+                                                 tzinfo=utc)
+
+        # 01:30 occurs twice on November 7; the job runs the first time.
+        clock.set(datetime.datetime(2021, 11, 6, 12, 0, tzinfo=utc))
+        job = scheduler.every().day.at('01:30', tz=new_york).do(mock_job)
+        assert job.next_run.astimezone(utc) == \
+            datetime.datetime(2021, 11, 7, 5, 30, tzinfo=utc)
+
+    def test_cron_time_zone(self):
+        utc = datetime.timezone.utc
+        clock = schedule.FakeClock(datetime.datetime(2021, 3, 13, 12, 0,
+                                                     tzinfo=utc))
+        scheduler = schedule.Scheduler(clock=clock)
+        job = scheduler.cron('0 9 * * 1-5', tz='Europe/Amsterdam') \
+            .do(make_mock_job())
+        assert job.next_run == datetime.datetime(2021, 3, 15, 8, 0,
+                                                 tzinfo=utc)
+
+    def test_interval_job_does_not_drift(self):
+        start = datetime.datetime(2010, 1, 6, 12, 15)
+        clock = schedule.FakeClock(start)
+        scheduler = schedule.Scheduler(clock=clock)
+
+        async def slow_job():
+            clock.advance(3)
+
+        job = scheduler.every(10).seconds.do(slow_job)
+        clock.advance(10)
+        for n in range(2, 5):
+            self.run_async(scheduler.run_pending)
+            assert job.next_run == start + datetime.timedelta(seconds=10 * n)
+            clock.advance(7)
+
+        # Occurrences that passed while the job was late are skipped.
+        clock.advance(25)
+        self.run_async(scheduler.run_pending)
+        assert job.next_run == start + datetime.timedelta(seconds=70)
+
+    def test_fixed_rate(self):
+        clock = schedule.FakeClock(datetime.datetime(2010, 1, 6, 12, 15, 20))
+        scheduler = schedule.Scheduler(clock=clock)
+        next_runs = []
+
+        async def slow_job():
+            next_runs.append(job.next_run)
+            clock.advance(0.3)
+
+        job = scheduler.every().minute.at_fixed_rate().do(slow_job)
+        assert job.next_run == datetime.datetime(2010, 1, 6, 12, 16)
+        clock.advance(40)
+        self.run_async(scheduler.run_pending)
+        assert next_runs == [datetime.datetime(2010, 1, 6, 12, 17)]
+        assert job.next_run == datetime.datetime(2010, 1, 6, 12, 17)
+
+    def test_fixed_rate_overlap(self):
+        clock = schedule.FakeClock(datetime.datetime(2010, 1, 6, 12, 15))
+        scheduler = schedule.Scheduler(clock=clock)
+
+        async def main():
+            release = asyncio.Event()
+            job = scheduler.every().second.at_fixed_rate().do(release.wait)
+            clock.advance(1)
+            done, pending = await scheduler.run_pending(timeout=0)
+            assert pending
+            clock.advance(1)
+            await scheduler.run_pending()
+            # The skipped invocation left the job on the grid.
+            assert job.next_run == datetime.datetime(2010, 1, 6, 12, 15, 3)
+            release.set()
+            await asyncio.wait(pending)
+            assert job.next_run == datetime.datetime(2010, 1, 6, 12, 15, 3)
+
+        self.run_async(main)
+
+    def test_spread(self):
+        clock = schedule.FakeClock(datetime.datetime(2010, 1, 6, 12, 15, 30))
+        scheduler = schedule.Scheduler(clock=clock)
+        mock_job = make_mock_job()
+        jobs = [scheduler.every().minute.spread().do(mock_job)
+                for _ in range(60)]
+        assert jobs[0].next_run == datetime.datetime(2010, 1, 6, 12, 16)
+        runs = sorted(job.next_run for job in jobs)
+        gaps = [b - a for a, b in zip(runs, runs[1:])]
+        assert runs[-1] - runs[0] < datetime.timedelta(minutes=1)
+        assert max(gaps) < 3 * min(gaps)
+        self.assertRaises(AssertionError, jobs[0].spread)
+
+        job = scheduler.every().minute.spread('device-1').do(mock_job)
+        other = schedule.Scheduler(clock=clock).add_many([
+            {'func': mock_job, 'unit': 'minutes', 'spread': 'device-1'}])[0]
+        assert job.phase == other.phase
+        assert job.next_run == other.next_run
+
+        clock.advance(28)
+        self.run_async(scheduler.run_pending)
+        assert job.next_run == other.next_run + datetime.timedelta(minutes=1)
+
+    def test_misfire(self):
+        start = datetime.datetime(2010, 1, 6, 12, 15)
+        for coalesce, calls in (('once', 1), ('all', 2), ('skip', 0)):
+            clock = schedule.FakeClock(start)
+            scheduler = schedule.Scheduler(clock=clock)
+            mock_job = make_mock_job()
+            job = scheduler.every(10).seconds.do(mock_job) \
+                .misfire(grace_time=1, coalesce=coalesce)
+            clock.advance(11)
+            self.run_async(scheduler.run_pending)
+            assert mock_job.call_count == 1
+            mock_job.reset_mock()
+            clock.advance(24)  # the runs at 20s and 30s were missed
+            self.run_async(scheduler.run_pending)
+            assert mock_job.call_count == calls, coalesce
+            assert job.next_run == start + datetime.timedelta(seconds=40)
+
+    def test_max_concurrency(self):
+        clock = schedule.FakeClock(datetime.datetime(2010, 1, 6, 12, 15))
+        scheduler = schedule.Scheduler(clock=clock, max_concurrency=2)
+        running = set()
+        started = []
+        peak = []
+
+        async def job(n):
+            started.append(n)
+            running.add(n)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.discard(n)
+
+        for n in range(5):
+            scheduler.every(60 - n).seconds.do(job, n)
+        clock.advance(60)
+        self.run_async(scheduler.run_pending)
+        assert max(peak) == 2
+        assert started == [4, 3, 2, 1, 0]
+
+    def test_tag_concurrency(self):
+        clock = schedule.FakeClock(datetime.datetime(2010, 1, 6, 12, 15))
+        scheduler = schedule.Scheduler(clock=clock,
+            tag_concurrency={'db': 1})
+        running = {'db': 0, 'other': 0}
+        peak = {'db': 0, 'other': 0}
+
+        async def job(tag):
+            running[tag] += 1
+            peak[tag] = max(peak[tag], running[tag])
+            await asyncio.sleep(0.01)
+            running[tag] -= 1
+
+        for _ in range(3):
+            scheduler.every().second.do(job, 'db').tag('db')
+            scheduler.every().second.do(job, 'other').tag('other')
+        clock.advance(1)
+        self.run_async(scheduler.run_pending)
+        assert peak == {'db': 1, 'other': 3}
+
+    def test_tag_concurrency_does_not_hold_global_slots(self):
+        clock = schedule.FakeClock(datetime.datetime(2010, 1, 6, 12, 15))
+        scheduler = schedule.Scheduler(clock=clock, max_concurrency=2,
+            tag_concurrency={'db': 1})
+        release = asyncio.Event()
+        finished = []
+
+        async def db_job():
+            await release.wait()
+            finished.append('db')
+
+        async def other_job():
+            finished.append('other')
+            release.set()
+
+        # The second db job waits for the first one, which waits for
+        # the untagged job.
+        scheduler.every(58).seconds.do(db_job).tag('db')
+        scheduler.every(59).seconds.do(db_job).tag('db')
+        scheduler.every(60).seconds.do(other_job)
+        clock.advance(60)
+        self.run_async(scheduler.run_pending, timeout=1)
+        assert finished == ['other', 'db', 'db']
+
+    def run_overlapping(self, policy, invocations=2):
+        async def main():
+            scheduler = schedule.Scheduler()
+            release = asyncio.Event()
+            calls = []
+
+            async def job():
+                calls.append(len(calls))
+                await release.wait()
+                return len(calls)
+
+            job = scheduler.every().second.do(job).overlap(policy)
+            tasks = []
+            for _ in range(invocations):
+                tasks.append(asyncio.create_task(job.run()))
+                await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            return calls, results
+
+        return self.run_async(main)
+
+    def test_overlap_skip(self):
+        calls, results = self.run_overlapping('skip')
+        assert calls == [0]
+        assert results == [1, None]
+
+    def test_overlap_queue(self):
+        calls, results = self.run_overlapping('queue', invocations=3)
+        assert calls == [0, 1]
+        assert results == [1, 2, None]
+
+    def test_overlap_cancel_previous(self):
+        calls, results = self.run_overlapping('cancel_previous')
+        assert calls == [0, 1]
+        assert isinstance(results[0], asyncio.CancelledError)
+        assert results[1] == 2
+
+    def test_timeout(self):
+        clock = schedule.FakeClock(datetime.datetime(2010, 1, 6, 12, 15))
+        instrument = RecordingInstrument()
+        scheduler = schedule.Scheduler(clock=clock, job_timeout=0.01,
+            instruments=[instrument])
+        cancelled = []
+
+        async def hung_job():
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def failing_job():
+            raise TimeoutError('from the job')
+
+        hung = scheduler.every().minute.do(hung_job)
+        failing = scheduler.every().minute.do(failing_job).timeout(5)
+        assert failing.run_timeout == 5
+        clock.advance(60)
+        done, pending = self.run_async(scheduler.run_pending)
+        assert not pending
+        errors = sorted(str(task.exception()) for task in done)
+        assert errors == ['0.01', 'from the job']
+        assert cancelled == [True]
+        assert ('error', schedule.JobTimeout, 0.0) in instrument.events
+        assert hung.next_run == datetime.datetime(2010, 1, 6, 12, 17)
+        assert failing.next_run == datetime.datetime(2010, 1, 6, 12, 17)
+
+    def test_timeout_waits_for_cancelled_run(self):
+        clock = schedule.FakeClock(datetime.datetime(2010, 1, 6, 12, 15))
+        scheduler = schedule.Scheduler(clock=clock, job_timeout=0.01)
+        released = asyncio.Event()
+        cleaned_up = []
+
+        async def slow_cleanup():
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                await asyncio.sleep(0.01)
+                cleaned_up.append(True)
+                raise ValueError('from the cleanup')
+
+        async def stubborn():
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                await released.wait()
+
+        job = scheduler.every().minute.do(slow_cleanup)
+        self.assertRaises(schedule.JobTimeout, self.run_async, job.run)
+        assert cleaned_up == [True]
+
+        job = scheduler.every().minute.do(stubborn)
+        with mock.patch.object(schedule, '_CANCEL_GRACE', 0.01), \
+                self.assertLogs('schedule', 'WARNING') as logs:
+            self.assertRaises(schedule.JobTimeout, self.run_async, job.run)
+        assert 'did not stop' in logs.output[0]
+        released.set()
+        self.run_async(asyncio.sleep, 0)
+
+    def test_retry(self):
+        start = datetime.datetime(2010, 1, 6, 12, 15)
+        clock = schedule.FakeClock(start)
+        errors = []
+        scheduler = schedule.Scheduler(clock=clock,
+            on_error=lambda job, exception: errors.append(exception))
+        calls = []
+
+        async def flaky_job():
+            calls.append(clock.now())
+            if len(calls) <= 3:
+                raise ValueError
+
+        job = scheduler.every().minute.retry(2, backoff=10).do(flaky_job)
+        clock.advance(60)
+        done, _ = self.run_async(scheduler.run_pending)
+        assert [task.result() for task in done] == [None]
+        backoff = job.next_run - clock.now()
+        assert 5 <= backoff.total_seconds() <= 10
+
+        clock.set(job.next_run)
+        self.run_async(scheduler.run_pending)
+        backoff = job.next_run - clock.now()
+        assert 10 <= backoff.total_seconds() <= 20
+
+        # The retries ran out, the job returns to its regular schedule.
+        clock.set(job.next_run)
+        self.run_async(scheduler.run_pending)
+        assert job.next_run == datetime.datetime(2010, 1, 6, 12, 17)
+        assert len(errors) == 3
+        assert all(isinstance(error, ValueError) for error in errors)
+
+        clock.set(job.next_run)
+        self.run_async(scheduler.run_pending)
+        assert len(calls) == 4
+        assert job.next_run == datetime.datetime(2010, 1, 6, 12, 18)
+
+    def test_do_in_thread(self):
+        scheduler = schedule.Scheduler()
+        job = scheduler.every().second.do_in_thread(threading.get_ident)
+        try:
+            assert self.run_async(job.run) != threading.get_ident()
+        finally:
+            scheduler.shutdown()
+        assert job.next_run is not None
+
+    def test_do_in_process(self):
+        scheduler = schedule.Scheduler()
+        job = scheduler.every().second.do_in_process(os.getpid)
+        try:
+            assert self.run_async(job.run) != os.getpid()
+        finally:
+            scheduler.shutdown()
+
+    def test_executors_are_configurable(self):
+        executor = mock.Mock()
+        scheduler = schedule.Scheduler(executors={'thread': executor})
+        scheduler.shutdown(wait=False)
+        executor.shutdown.assert_called_once_with(wait=False)
+
+    def test_get_jobs_by_tag(self):
+        job1 = every().second.do(make_mock_job(name='job1')).tag('tag1')
+        job2 = every().second.do(make_mock_job(name='job2'))
+        job3 = every().second.do(make_mock_job(name='job3')).tag('tag1')
+        job2.tag('tag1', 'tag2')
+        assert schedule.get_jobs('tag1') == [job1, job3, job2]
+        assert schedule.get_jobs('tag2') == [job2]
+        assert schedule.get_jobs('tag3') == []
+        assert schedule.get_jobs() == [job1, job2, job3]
+
+        schedule.cancel_job(job2)
+        assert schedule.get_jobs('tag1') == [job1, job3]
+        assert schedule.get_jobs('tag2') == []
+        schedule.clear('tag1')
+        assert schedule.get_jobs() == []
+
+    def test_get_job_by_id(self):
+        job = every().second.do(make_mock_job())
+        assert job.id is not None
+        assert schedule.default_scheduler.get_job(job.id) is job
+        schedule.cancel_job(job)
+        assert schedule.default_scheduler.get_job(job.id) is None
+
+    def test_jobs_view(self):
+        job1 = every().second.do(make_mock_job(name='job1'))
+        job2 = every().second.do(make_mock_job(name='job2'))
+        assert list(schedule.jobs) == [job1, job2]
+        assert schedule.jobs[-1] is job2
+        assert schedule.jobs[:1] == [job1]
+        assert job1 in schedule.jobs
+        assert 'Not a job' not in schedule.jobs
+        self.assertRaises(IndexError, schedule.jobs.__getitem__, 2)
+
+    def test_add_many(self):
+        clock = schedule.FakeClock(datetime.datetime(2010, 1, 6, 12, 15))
+        scheduler = schedule.Scheduler(clock=clock)
+        mock_job = make_mock_job()
+        first = scheduler.every(5).seconds.do(mock_job)
+        jobs = scheduler.add_many([
+            {'func': mock_job, 'interval': 10, 'unit': 'seconds',
+             'args': (1,), 'tags': ['poll']},
+            {'func': mock_job, 'unit': 'minutes', 'kwargs': {'n': 2},
+             'id': 'device'},
+            {'func': mock_job, 'interval': 20, 'unit': 'seconds',
+             'id': 'device'},
+        ])
+        assert len(jobs) == 2
+        assert list(scheduler.jobs) == [first] + jobs
+        assert scheduler.get_jobs('poll') == jobs[:1]
+        assert scheduler.get_job('device') is jobs[1]
+        assert jobs[0].job_func.args == (1,)
+        assert jobs[0].next_run == datetime.datetime(2010, 1, 6, 12, 15, 10)
+        assert jobs[1].next_run == datetime.datetime(2010, 1, 6, 12, 15, 20)
+
+        # An invalid spec leaves none of the batch registered.
+        self.assertRaises(KeyError, scheduler.add_many, [
+            {'func': mock_job, 'unit': 'seconds', 'id': 'device'},
+            {'func': mock_job},
+        ])
+        assert list(scheduler.jobs) == [first] + jobs
+        assert scheduler.get_job('device') is jobs[1]
+
+        clock.advance(10)
+        self.run_async(scheduler.run_pending)
+        assert mock_job.call_count == 2
+        assert jobs[0].next_run == datetime.datetime(2010, 1, 6, 12, 15, 20)
+
+    def test_add_many_tags(self):
+        scheduler = schedule.Scheduler()
+        mock_job = make_mock_job()
+        single, several = scheduler.add_many([
+            {'func': mock_job, 'unit': 'seconds', 'tags': 'poll'},
+            {'func': mock_job, 'unit': 'seconds', 'tags': ('poll', 'x')},
+        ])
+        assert single.tags == {'poll'}
+        assert several.tags == {'poll', 'x'}
+        assert scheduler.get_jobs('poll') == [single, several]
+        assert scheduler.get_jobs('p') == []
+        self.assertRaises(TypeError, scheduler.add_many, [
+            {'func': mock_job, 'unit': 'seconds', 'tags': [['poll']]}])
+        assert len(scheduler.jobs) == 2
+
+    def test_job_has_no_instance_dict(self):
+        job = every().second.do(make_mock_job(), 1, foo=2)
+        assert not hasattr(job, '__dict__')
+        assert not hasattr(job.job_func, '__dict__')
+        assert job.job_func.args == (1,)
+        assert job.job_func.keywords == {'foo': 2}
+        assert job.period == datetime.timedelta(seconds=1)
+
+    def test_job_label(self):
+        job = every().second.do(make_mock_job(name='job1'), 'x' * 100)
+        assert job.label == 'job1 (id %s)' % job.id
+        assert job.label is job.label
+
+    def test_log_sampling(self):
+        scheduler = schedule.Scheduler(log_sample_rate=0)
+        job = scheduler.every().second.do(make_mock_job())
+        with self.assertLogs('schedule', level='DEBUG') as logs:
+            logging.getLogger('schedule').debug('start')
+            self.run_async(job.run)
+        assert logs.output == ['DEBUG:schedule:start']
+
+        scheduler.log_sample_rate = 1
+        with self.assertLogs('schedule', level='INFO') as logs:
+            self.run_async(job.run)
+        assert logs.records[0].getMessage() == 'Running job %s' % job.label
+        assert logs.records[0].job_id == job.id
+
     def test_misconfigured_job_wont_break_scheduler(self):
         """
         Ensure an interrupted job definition chain won't break
@@ -355,5 +1058,407 @@ class SchedulerTests(unittest.TestCase):
         self.run_async(scheduler.run_pending)
 
 
+class RecordingInstrument(schedule.Instrument):
+    def __init__(self):
+        self.events = []
+
+    def pre_run(self, job, lateness, queue_wait):
+        self.events.append(('pre_run', lateness, queue_wait))
+
+    def post_run(self, job, duration):
+        self.events.append(('post_run', duration))
+
+    def error(self, job, exception, duration):
+        self.events.append(('error', type(exception), duration))
+
+    def skipped(self, job, reason):
+        self.events.append(('skipped', reason))
+
+
+class InstrumentationTests(AsyncTestCase):
+    def setUp(self):
+        self.clock = schedule.FakeClock(datetime.datetime(2010, 1, 6, 12, 15))
+
+    def test_hooks(self):
+        instrument = RecordingInstrument()
+        scheduler = schedule.Scheduler(clock=self.clock,
+            instruments=[instrument])
+        clock = self.clock
+
+        async def job():
+            clock.advance(0.5)
+
+        async def failing_job():
+            raise ValueError
+
+        scheduler.every().minute.do(job)
+        scheduler.every().minute.do(failing_job)
+        clock.advance(62)
+        self.run_async(scheduler.run_pending)
+        assert instrument.events == [
+            ('pre_run', 2.0, 0.0),
+            ('post_run', 0.5),
+            ('pre_run', 2.5, 0.0),
+            ('error', ValueError, 0.0),
+        ]
+
+    def test_queue_wait(self):
+        instrument = RecordingInstrument()
+        scheduler = schedule.Scheduler(clock=self.clock, max_concurrency=1,
+            instruments=[instrument])
+        clock = self.clock
+
+        async def job():
+            await asyncio.sleep(0)
+            clock.advance(0.5)
+
+        # Due and dispatched at monotonic time 0.
+        for _ in range(2):
+            scheduler.every().minute.do(job).next_run = clock.now()
+        self.run_async(scheduler.run_pending)
+        assert [event for event in instrument.events
+                if event[0] == 'pre_run'] == [
+            ('pre_run', 0.0, 0.0),
+            ('pre_run', 0.5, 0.5),
+        ]
+
+    def test_skipped_hook(self):
+        instrument = RecordingInstrument()
+        scheduler = schedule.Scheduler(instruments=[instrument])
+
+        async def main():
+            job = scheduler.every().second.do(asyncio.sleep, 0.01)
+            await asyncio.gather(job.run(), job.run())
+
+        self.run_async(main)
+        assert ('skipped', 'overlap') in instrument.events
+
+    def test_job_metrics(self):
+        metrics = JobMetrics()
+        scheduler = schedule.Scheduler(clock=self.clock,
+            instruments=[metrics])
+
+        async def failing_job():
+            raise ValueError
+
+        job = scheduler.every().minute.do(make_mock_job('ok'))
+        failing = scheduler.every().minute.do(failing_job)
+        for _ in range(3):
+            self.clock.advance(60)
+            self.run_async(scheduler.run_pending)
+
+        snapshot = metrics.snapshot()
+        assert snapshot[job.id]['name'] == 'ok'
+        assert snapshot[job.id]['runs'] == 3
+        assert snapshot[job.id]['failures'] == 0
+        assert snapshot[job.id]['duration']['count'] == 3
+        assert snapshot[failing.id]['failures'] == 3
+
+        text = metrics.render_prometheus()
+        assert 'aioschedule_job_runs_total{job="%s",func="ok"} 3' % job.id \
+            in text.splitlines()
+        assert 'aioschedule_job_duration_seconds_bucket{job="%s",func="ok",le="+Inf"} 3' \
+            % job.id in text.splitlines()
+
+        metrics.forget(job)
+        assert job.id not in metrics.snapshot()
+
+    def test_histogram_quantiles(self):
+        histogram = Histogram((1.0, 2.0, 4.0))
+        assert histogram.quantile(0.5) is None
+        for value in (0.5, 1.5, 1.5, 3.0):
+            histogram.observe(value)
+        assert histogram.count == 4
+        assert histogram.sum == 6.5
+        assert histogram.quantile(0.5) == 1.5
+        assert histogram.quantile(1) == 4.0
+        histogram.observe(100)
+        assert histogram.quantile(1) == 4.0
+
+
+class CronTests(AsyncTestCase):
+    def assert_next_fire(self, expression, after, expected):
+        assert CronExpression(expression).next_fire(after) == expected
+
+    def test_next_fire(self):
+        dt = datetime.datetime
+        friday = dt(2010, 1, 8, 17, 56, 30)
+        self.assert_next_fire('*/5 9-17 * * 1-5', dt(2010, 1, 8, 12, 0),
+            dt(2010, 1, 8, 12, 5))
+        self.assert_next_fire('*/5 9-17 * * 1-5', friday,
+            dt(2010, 1, 11, 9, 0))
+        self.assert_next_fire('*/5 9-17 * * mon-fri', friday,
+            dt(2010, 1, 11, 9, 0))
+        self.assert_next_fire('0 0 29 2 *', friday, dt(2012, 2, 29))
+        self.assert_next_fire('59 23 31 12 *', friday,
+            dt(2010, 12, 31, 23, 59))
+        self.assert_next_fire('@hourly', friday, dt(2010, 1, 8, 18, 0))
+        self.assert_next_fire('0 12 * * 7', friday, dt(2010, 1, 10, 12, 0))
+        self.assert_next_fire('0 12 * jun sun', friday, dt(2010, 6, 6, 12))
+        self.assert_next_fire('0,30 8-10/2 * * *', friday,
+            dt(2010, 1, 9, 8, 0))
+        # The day of the month *or* the day of the week must match.
+        self.assert_next_fire('0 0 13 * 5', dt(2010, 1, 9),
+            dt(2010, 1, 13))
+        self.assert_next_fire('0 0 13 * 5', dt(2010, 1, 13),
+            dt(2010, 1, 15))
+        # A stepped field is restricted: every other day of the month,
+        # and the 1st, 16th and 31st or Mondays.
+        self.assert_next_fire('0 0 */2 * *', dt(2010, 1, 1),
+            dt(2010, 1, 3))
+        self.assert_next_fire('0 0 */2 * *', dt(2010, 1, 31),
+            dt(2010, 2, 1))
+        self.assert_next_fire('0 0 * * */3', dt(2010, 1, 10),
+            dt(2010, 1, 13))
+        self.assert_next_fire('0 0 */15 * 1', dt(2010, 1, 1),
+            dt(2010, 1, 4))
+        self.assert_next_fire('0 0 */15 * 1', dt(2010, 1, 11),
+            dt(2010, 1, 16))
+        self.assert_next_fire('0 0 */15 * 1', dt(2010, 1, 25),
+            dt(2010, 1, 31))
+
+    def test_invalid_expressions(self):
+        for expression in ('* * * *', '60 * * * *', '* * 0 * *',
+                           '*/0 * * * *', '5-1 * * * *', '* * * foo *'):
+            self.assertRaises(ValueError, CronExpression, expression)
+        self.assertRaises(ValueError,
+            CronExpression('0 0 30 2 *').next_fire, datetime.datetime.now())
+
+    def test_cron_job(self):
+        clock = schedule.FakeClock(datetime.datetime(2010, 1, 8, 17, 50))
+        scheduler = schedule.Scheduler(clock=clock)
+        mock_job = make_mock_job()
+        job = scheduler.cron('*/5 9-17 * * 1-5').do(mock_job)
+        assert repr(job).startswith("Cron '*/5 9-17 * * 1-5' do job()")
+        assert job.next_run == datetime.datetime(2010, 1, 8, 17, 55)
+        assert job.cron is scheduler.cron('*/5 9-17 * * 1-5').cron
+
+        clock.advance(5 * 60)
+        self.run_async(scheduler.run_pending)
+        assert mock_job.call_count == 1
+        assert job.next_run == datetime.datetime(2010, 1, 11, 9, 0)
+        assert scheduler.idle_seconds == (3 * 24 * 60 - 8 * 60 - 55) * 60
+
+    def test_cron_misfire(self):
+        clock = schedule.FakeClock(
+            datetime.datetime(2010, 1, 8, 12, 4, 59, 999000))
+        scheduler = schedule.Scheduler(clock=clock)
+        mock_job = make_mock_job()
+        job = scheduler.cron('*/5 * * * *').do(mock_job) \
+            .misfire(grace_time=1, coalesce='all')
+        assert job.period == datetime.timedelta(minutes=5)
+        clock.advance(20 * 60 + 0.001)  # 12:05 to 12:25 were missed
+        self.run_async(scheduler.run_pending)
+        assert mock_job.call_count == 5
+        assert job.next_run == datetime.datetime(2010, 1, 8, 12, 30)
+
+
+class JobStoreTests(TempDirMixin, AsyncTestCase):
+    def setUp(self):
+        super().setUp()
+        self.clock = schedule.FakeClock(datetime.datetime(2010, 1, 6, 12, 15))
+        self.path = os.path.join(self.tmp.name, 'jobs.db')
+        self.job = make_mock_job('report')
+
+    def new_scheduler(self):
+        scheduler = schedule.Scheduler(clock=self.clock,
+            jobstore=SQLiteJobStore(self.path))
+        scheduler.register(self.job, 'report')
+        return scheduler
+
+    def test_restore(self):
+        scheduler = self.new_scheduler()
+        job = scheduler.every(5).to(10).minutes.with_id('report') \
+            .do(self.job, 'x', n=1).tag('reports').timeout(30) \
+            .until(datetime.datetime(2011, 1, 1)).times(100)
+        daily = scheduler.every().day.at('10:30').do(self.job)
+        weekdays = scheduler.cron('0 9 * * 1-5').do(self.job)
+        tokyo = scheduler.every().day.at('09:00', tz='Asia/Tokyo') \
+            .do(self.job)
+        scheduler.every().minute.do(make_mock_job('unregistered'))
+        self.clock.advance(600)
+        self.run_async(scheduler.run_pending)
+        scheduler.jobstore.close()
+
+        self.clock.advance(30)
+        restarted = self.new_scheduler()
+        restored = restarted.restore()
+        assert len(restored) == 4
+        job2 = restarted.get_job('report')
+        assert repr(job2) == repr(job)
+        assert job2.tags == {'reports'}
+        assert job2.run_timeout == 30
+        assert job2.until_time == datetime.datetime(2011, 1, 1)
+        assert job2.runs_left == job.runs_left == 99
+        assert job2.period == job.period
+        assert job2.next_run == job.next_run
+        assert restarted.next_run == job.next_run
+        assert restarted.idle_seconds == \
+            (job.next_run - self.clock.now()).total_seconds()
+        assert repr(restarted.get_job(daily.id)) == repr(daily)
+        assert repr(restarted.get_job(weekdays.id)) == repr(weekdays)
+        tokyo2 = restarted.get_job(tokyo.id)
+        assert tokyo2.tz == tokyo.tz
+        assert tokyo2.next_run == tokyo.next_run
+        assert tokyo2._due - restarted.clock.monotonic_ns() == \
+            tokyo._due - scheduler.clock.monotonic_ns()
+
+        # Auto-assigned ids do not collide with restored jobs.
+        assert restarted.every().minute.do(self.job).id not in (
+            'report', daily.id, weekdays.id, tokyo.id)
+
+    def test_incremental_checkpoint(self):
+        scheduler = self.new_scheduler()
+        job = scheduler.every().minute.do(self.job)
+        scheduler.checkpoint()
+        writes = []
+        write = scheduler.jobstore.write
+        scheduler.jobstore.write = lambda *args: writes.append(args) \
+            or write(*args)
+
+        self.clock.advance(60)
+        self.run_async(scheduler.run_pending)
+        assert writes == [([], [(job.id, job._last_run, job._next_run,
+                                 job._period)], [])]
+        self.run_async(scheduler.run_pending)
+        assert len(writes) == 1
+
+        scheduler.cancel_job(job)
+        scheduler.checkpoint()
+        assert writes[-1] == ([], [], [job.id])
+        assert list(scheduler.jobstore.load()) == []
+
+    def test_same_id_replaces_job(self):
+        scheduler = self.new_scheduler()
+        job1 = scheduler.every().minute.with_id('report').do(self.job)
+        job2 = scheduler.every().hour.with_id('report').do(self.job)
+        assert list(scheduler.jobs) == [job2]
+        assert not job1._registered
+        scheduler.checkpoint()
+        [record] = scheduler.jobstore.load()
+        assert record['unit'] == 'hours'
+
+
+    def test_builders_save_stored_jobs(self):
+        scheduler = self.new_scheduler()
+        job = scheduler.every().minute.with_id('report').do(self.job)
+        scheduler.checkpoint()
+        job.overlap('queue').misfire(5, 'all').timeout(30).retry(3) \
+            .until(datetime.datetime(2011, 1, 1)).times(10).at_fixed_rate()
+        scheduler.checkpoint()
+        scheduler.jobstore.close()
+
+        restored = self.new_scheduler().restore()[0]
+        assert restored.overlap_policy == 'queue'
+        assert (restored.misfire_grace_time, restored.coalesce) == (5, 'all')
+        assert restored.run_timeout == 30
+        assert restored.retry_attempts == 3
+        assert restored.until_time == datetime.datetime(2011, 1, 1)
+        assert restored.runs_left == 10
+        assert restored.fixed_rate
+
+
+class LockTests(TempDirMixin, AsyncTestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.tmp.name, 'locks.db')
+
+    def test_lease(self):
+        backend = SQLiteLockBackend(self.path)
+        assert self.run_async(backend.acquire, 'job@1', 60)
+        assert not self.run_async(backend.acquire, 'job@1', 60)
+        assert not self.run_async(SQLiteLockBackend(self.path).acquire,
+            'job@1', 60)
+        assert self.run_async(backend.acquire, 'job@2', -1)
+        assert self.run_async(backend.acquire, 'job@2', 60)
+        backend.close()
+
+    def test_replicas_run_each_occurrence_once(self):
+        mock_job = make_mock_job()
+        instrument = RecordingInstrument()
+        replicas = []
+        for start in (datetime.datetime(2010, 1, 6, 12, 15),
+                      datetime.datetime(2010, 1, 6, 12, 15, 20)):
+            scheduler = schedule.Scheduler(clock=schedule.FakeClock(start),
+                instruments=[instrument],
+                lock_backend=SQLiteLockBackend(self.path))
+            scheduler.every().minute.with_id('sync').do(mock_job)
+            replicas.append(scheduler)
+        for _ in range(3):
+            for scheduler in replicas:
+                scheduler.clock.advance(60)
+                self.run_async(scheduler.run_pending)
+        assert mock_job.call_count == 3
+        assert instrument.events.count(('skipped', 'locked')) == 3
+        assert replicas[1].get_job('sync').next_run == \
+            datetime.datetime(2010, 1, 6, 12, 19, 20)
+
+    def test_early_runs_do_not_take_the_lease(self):
+        mock_job = make_mock_job()
+        clock = schedule.FakeClock(datetime.datetime(2010, 1, 6, 12, 15))
+        scheduler = schedule.Scheduler(clock=clock,
+            lock_backend=SQLiteLockBackend(self.path))
+        job = scheduler.every().hour.with_id('report').do(mock_job)
+        self.run_async(scheduler.run_all)
+        self.run_async(job.run)
+        assert mock_job.call_count == 2
+        assert job.next_run == datetime.datetime(2010, 1, 6, 13, 15)
+        clock.advance(60 * 60)
+        self.run_async(scheduler.run_pending)
+        assert mock_job.call_count == 3
+
+
+async def touch(path):
+    with open(path, 'a') as f:
+        f.write('.')
+
+
+class ShardingTests(AsyncTestCase):
+    def test_hash_ring(self):
+        keys = ['device-%d' % n for n in range(10000)]
+        four, five = HashRing(4), HashRing(5)
+        before = [four.shard(key) for key in keys]
+        after = [five.shard(key) for key in keys]
+        assert all(0.85 < before.count(shard) / 2500 < 1.15
+                   for shard in range(4))
+        moved = [b for a, b in zip(before, after) if a != b]
+        assert set(moved) == {4}
+        assert 0.15 < len(moved) / len(keys) < 0.25
+
+    def test_sharded_scheduler(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                ShardedScheduler(2, 'fork') as scheduler:
+            path = os.path.join(tmp, 'runs')
+            ids = scheduler.add_many(
+                {'func': touch, 'unit': 'hours', 'args': (path,)}
+                for _ in range(1000))
+            assert len(set(ids)) == 1000
+            job = scheduler.every(0.05).seconds.with_id('fast').do(touch, path)
+            job.tag('fast')
+            self.assertRaises(RuntimeError, self.run_async, job.run)
+            assert sum(scheduler.job_counts()) == 1001
+            assert min(scheduler.job_counts()) > 400
+            # The replies of all workers are read when they fail.
+            self.assertRaises(TypeError, scheduler.clear, ['fast'])
+            assert sum(scheduler.job_counts()) == 1001
+
+            assert 300 < scheduler.resize(3) < 370
+            assert sum(scheduler.job_counts()) == 1001
+            self.assertRaises(KeyError, scheduler.add_many,
+                [{'func': touch, 'unit': 'hours', 'args': (path,)}] * 10 +
+                [{'func': touch}])
+            assert sum(scheduler.job_counts()) == 1001
+            time.sleep(0.3)
+            assert os.path.exists(path)
+
+            scheduler.cancel_job(ids[0])
+            scheduler.clear('fast')
+            assert sum(scheduler.job_counts()) == 999
+            assert scheduler.resize(1) > 600
+            assert scheduler.job_counts() == [999]
+            scheduler.clear()
+            assert scheduler.job_counts() == [0]
+
+
 if __name__ == '__main__':
     unittest.main()